@@ -22,6 +22,7 @@ import src.fw.robot.unit as unit_module
 
 from src.fw.utils.error import PlatformError
 from src.fw.utils.logging.logger_factory import DefaultLoggerFactory
+from src.fw.utils.logging.logging_output import flush_printing_outputs
 
 
 class Platform:
@@ -237,6 +238,9 @@ class Platform:
                 # Spuštění běhového prostředí
                 runtime.run()
 
+        # Vypsání všech logů, které ještě zůstaly v bufferu
+        flush_printing_outputs()
+
 
 class PlatformLoadingError(PlatformError):
     """Výjimka symbolizující vznik problému při načítání platformy a jejích
@@ -29,6 +29,7 @@ import src.fw.platform.platform as platform_module
 import src.fw.target.event_handling as event_module
 import src.fw.platform.runtime_events as runtime_events
 import src.fw.utils.logging.logger as logger_module
+import src.fw.utils.logging.logging_output as output_module
 
 
 class AbstractRuntime(Identifiable, event_module.EventEmitter):
@@ -195,6 +196,9 @@ class AbstractRuntime(Identifiable, event_module.EventEmitter):
         # Tvorba světa
         self._world = self.world_factory.build(self.logger)
 
+        # Prostor hotového světa se již nemění; je tedy zmrazen
+        self._world.freeze()
+
         # Dodání reference světa pro přípravu úlohy; aby úloha mohla být
         # provázána se světem a sledovat v něm plnění úkolů této úlohy
         self._target = self.target_factory.build(self._world, self.logger)
@@ -404,8 +408,14 @@ class SingleRobotRuntime(AbstractRuntime):
             if self.any_error_occured:
                 self.log(self.error_holder.exception_type_name, ":",
                          self.error_holder.exception)
+
+                # Vypsání bufferovaných logů před přímým výpisem chyby
+                output_module.flush_printing_outputs()
                 print(self.error_holder.traceback)
 
+            # Vypsání všech logů, které v bufferu po běhu zůstaly
+            output_module.flush_printing_outputs()
+
 
 class AbstractRuntimeFactory(ABC):
     """Tovární třída běhových prostředí je odpovědná za budování instancí
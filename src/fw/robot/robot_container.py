@@ -16,6 +16,8 @@ class RobotContainer(ABC):
     Počítá se zde s možnou variancí v rámci způsobu implementace a způsobu
     užití jednotlivých potomků této třídy."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def has_any_robot(self) -> bool:
@@ -31,7 +33,12 @@ class RobotContainer(ABC):
 class SingleRobotContainer(RobotContainer):
     """Tento kontejner představuje kontejner, do kterého se 'vejde' pouze
     jeden robot. Způsobem použití je typicky uchování reference na jediného
-    robota, přičemž silně apelujeme na ochranu před jeho přepsáním."""
+    robota, přičemž silně apelujeme na ochranu před jeho přepsáním.
+
+    Jediný atribut (robot) je uložen ve slotu. Třída je tak kombinovatelná
+    s předky s prázdnými sloty (např. Markable)."""
+
+    __slots__ = ("_robot",)
 
     def __init__(self):
         """Jednoduchý initor odpovědný za 'deklaraci' pole pro uchování
@@ -88,8 +95,14 @@ class MultiRobotContainer(RobotContainer):
 
     def __init__(self):
         """Jednoduchý initor odpovědný za 'deklaraci' seznamu reprezentujícího
-        evidenci robotů. Defaultně je tento seznam prázdný."""
+        evidenci robotů. Defaultně je tento seznam prázdný.
+
+        Ntice robotů vydávaná vlastností 'robots' je uchovávána a vytvořena
+        znovu až po změně evidence. Kromě seznamu (udržujícího pořadí) jsou
+        roboti evidováni i v množině pro rychlé ověření přítomnosti."""
         self._robots: "list[robot_module.Robot]" = []
+        self._robots_set: "set[robot_module.Robot]" = set()
+        self._robots_tuple: "tuple[robot_module.Robot]" = None
 
     @property
     def has_any_robot(self) -> bool:
@@ -100,12 +113,15 @@ class MultiRobotContainer(RobotContainer):
     @property
     def robots(self) -> "tuple[robot_module.Robot]":
         """Vlastnost vrací ntici všech evidovaných robotů."""
-        return tuple(self._robots)
+        robots = self._robots_tuple
+        if robots is None:
+            robots = self._robots_tuple = tuple(self._robots)
+        return robots
 
     def has_robot(self, robot: "robot_module.Robot") -> bool:
         """Funkce vrací informaci o tom, zda-li dodaný robot již v evidenci
         obsažen je. Pokud ano, je vrácena hodnota True, jinak False."""
-        return robot in self.robots
+        return robot in self._robots_set
 
     def add_robot(self, robot: "robot_module.Robot"):
         """Funkce se pokusí zařadit robota do evidence. Pokud již jednou
@@ -114,6 +130,8 @@ class MultiRobotContainer(RobotContainer):
             raise RobotContainerError(
                 f"Nelze stejného robota evidovat dvakrát: {robot}", self)
         self._robots.append(robot)
+        self._robots_set.add(robot)
+        self._robots_tuple = None
 
     def remove_robot(self, robot: "robot_module.Robot"):
         """Funkce se pokusí vyhodit dodaného robota z evidence.
@@ -126,6 +144,8 @@ class MultiRobotContainer(RobotContainer):
             raise RobotContainerError(
                 f"V evidenci není robot {robot}", self)
         self._robots.remove(robot)
+        self._robots_set.discard(robot)
+        self._robots_tuple = None
 
 
 class RobotContainerError(PlatformError):
@@ -61,6 +61,13 @@ class EventEmitter(ABC):
         událostí tohoto emitoru."""
         return tuple(self._event_handlers)
 
+    @property
+    def has_any_event_handler(self) -> bool:
+        """Vlastnost vrací, zda-li má tento emitor v evidenci alespoň jednoho
+        posluchače. Lze jí využít k vynechání tvorby události, kterou by
+        stejně nikdo nepřijal."""
+        return len(self._event_handlers) > 0
+
     def has_event_handler(self, handler: "EventHandler") -> bool:
         """Funkce vrací, zda-li má v evidenci uvedeného tohoto posluchače."""
         return handler in self.event_handlers
@@ -12,6 +12,7 @@ from src.fw.target.results.result_builder import (
 
 import src.fw.platform.platform as platform_module
 import src.fw.platform.runtime as runtime_module
+import src.fw.utils.logging.logging_output as output_module
 
 # Stanovená doporučená délka řádku
 _LINE_LENGTH = 80
@@ -28,6 +29,8 @@ class RuntimeResultPrinter(RuntimeResultBuilder):
     def build(self):
         """Tato metoda se stará o vypsání výsledků běhového prostředí
         do konzole."""
+        # Vypsání bufferovaných logů před přímým výpisem
+        output_module.flush_printing_outputs()
 
         print("\n")
         print(_LINE_LENGTH * "-")
@@ -83,6 +86,8 @@ class PlatformResultPrinter(PlatformResultBuilder):
     def build(self):
         """Funkce vypíše na konzoli celkové vyhodnocení platformy.
         """
+        # Vypsání bufferovaných logů před přímým výpisem
+        output_module.flush_printing_outputs()
 
         print("\n")
         print(_LINE_LENGTH * "=")
@@ -17,7 +17,13 @@ class Identifiable(ABC):
     identických ID. UUID je 128-bitová značka umožňující identifikaci v co
     nejširším kontextu. Riziko kolize dvou identických ID je pro verzi 4 tak
     malá, že je zanedbatelná a typicky zanedbávána (1 : 2.7 * 10^18);
-    viz https://en.wikipedia.org/wiki/Universally_unique_identifier. """
+    viz https://en.wikipedia.org/wiki/Universally_unique_identifier.
+
+    Třída sama sloty nedeklaruje (prázdná ntice), aby ji bylo možné
+    kombinovat s dalšími předky. Potomci se sloty si proto musí slot
+    '_Identifiable__id' deklarovat sami. """
+
+    __slots__ = ()
 
     def __init__(self):
         self.__id = uuid.uuid4()
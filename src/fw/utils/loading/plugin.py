@@ -32,6 +32,10 @@ class Plugin(ABC):
     modulu reprezentujícího daný plugin.
     """
 
+    # Instance vznikají pro každý vytipovaný soubor; atributy jsou pevné
+    __slots__ = ("_absolute_path", "_plugin_loader", "_module_path",
+                 "_module", "_functions")
+
     def __init__(self, abs_path: str, plugin_loader: pl_loader.PluginLoader):
         """Initor třídy přijímající absolutní cestu ke zdrojovému souboru,
         který reprezentuje daný plugin, a referenci na loader pluginů, který
@@ -55,6 +59,11 @@ class Plugin(ABC):
         # Převedení absolutní cesty na 'balíčkovou'
         self._module_path = module_path_from_abs(abs_path)
 
+        # Načtený modul a tabulka jeho funkcí; obojí je získáno až při
+        # prvním použití a dále sdíleno všemi validátory i přístupovými body
+        self._module: "ModuleType | None" = None
+        self._functions: "dict[str, Callable] | None" = None
+
         # Ověření, že dodaná absolutní cesta ukazuje na existující soubor
         if not (exists(abs_path) and is_file(abs_path)):
             raise PluginError(
@@ -105,9 +114,15 @@ class Plugin(ABC):
     def module(self) -> "ModuleType":
         """Vlastnost se pokusí načíst modul, kterým je plugin reprezentován.
         Pokud se načíst modul nepovede (typicky z důvodu syntaktické chyby),
-        je vyhozena výjimka PluginError."""
+        je vyhozena výjimka PluginError.
+
+        Úspěšně načtený modul je uchován, další přístupy jej tedy již znovu
+        nevyhledávají."""
+        if self._module is not None:
+            return self._module
         try:
-            return importlib.import_module(self.module_path)
+            self._module = importlib.import_module(self.module_path)
+            return self._module
         except Exception as e:
             raise PluginError(
                 f"Při načítání modulu '{self.module_path}' na cestě "
@@ -127,7 +142,15 @@ class Plugin(ABC):
         Vrací je v podobě ntice ntic, přičemž každá vnitřní obsahuje textový
         řetězec reprezentující název funkce a referenci na danou funkci.
         """
-        return tuple(getmembers(self.module, isfunction))
+        return tuple(self._function_table.items())
+
+    @property
+    def _function_table(self) -> "dict[str, Callable]":
+        """Interní vlastnost vrací slovník funkcí modulu pluginu podle jejich
+        názvů. Modul je prozkoumán pouze jednou; výsledek je uchován."""
+        if self._functions is None:
+            self._functions = dict(getmembers(self.module, isfunction))
+        return self._functions
 
     @property
     def all_function_names(self) -> "tuple[str]":
@@ -151,10 +174,7 @@ class Plugin(ABC):
     def has_function(self, fun_name: str) -> bool:
         """Funkce vrací informaci o tom, zda-li daný obsahuje funkci daného
         názvu."""
-        for func_desc in self.all_functions:
-            if func_desc[0] == fun_name:
-                return True
-        return False
+        return fun_name in self._function_table
 
     def get_attribute(self, attr_name: str) -> object:
         """Funkce vrací atribut (resp. jeho hodnotu), kterým je daný modul
@@ -171,9 +191,9 @@ class Plugin(ABC):
 
         Pokud není taková funkce nalezena, je vyhozena příslušná výjimka.
         """
-        for fun_description in self.all_functions:
-            if fun_description[0] == fun_name:
-                return fun_description[1]
+        function = self._function_table.get(fun_name)
+        if function is not None:
+            return function
         raise PluginError(
             f"Funkce názvu '{fun_name}' nebyla nalezena", self)
 
@@ -41,10 +41,12 @@ class PluginLoader(ABC):
                 f"Dodaná cesta neukazuje na existující adresář: {destination}",
                 self)
 
-        """Příprava seznamů pro identifikátory a validátory pluginů; v úvodní
-        fázi jsou tyto seznamy prázdné a lze je dodat dynamicky."""
-        self._plugin_identifiers: "list[identifier.PluginIdentifier]" = []
-        self._plugin_validators: "list[validator.PluginValidator]" = []
+        """Příprava ntic pro identifikátory a validátory pluginů; v úvodní
+        fázi jsou tyto ntice prázdné a lze je dodat dynamicky. Ntice jsou
+        neměnné, přidání tedy vždy vytvoří novou (copy-on-write); díky tomu
+        lze dodané ntice (např. výchozí konstanty) sdílet bez kopírování."""
+        self._plugin_identifiers: "tuple[identifier.PluginIdentifier]" = ()
+        self._plugin_validators: "tuple[validator.PluginValidator]" = ()
 
     @property
     def destination(self) -> str:
@@ -59,7 +61,7 @@ class PluginLoader(ABC):
         Tyto obvykle pracují jen na úrovni obecných popisných znaků; typicky
         zkoumají pouze název souboru, zda odpovídá definovaným konvencím.
         """
-        return tuple(self._plugin_identifiers)
+        return self._plugin_identifiers
 
     @property
     def validators(self) -> "tuple[validator.PluginValidator]":
@@ -70,7 +72,7 @@ class PluginLoader(ABC):
         a funkce a zda návratové hodnoty daných funkcí odpovídají předepsaným
         požadavkům.
         """
-        return tuple(self._plugin_validators)
+        return self._plugin_validators
 
     @property
     def potential_plugins(self) -> "tuple[str]":
@@ -121,24 +123,30 @@ class PluginLoader(ABC):
     def add_identifier(self, plugin_ident: "identifier.PluginIdentifier"):
         """Funkce přidává identifikátor pluginů, který bude použit pro
         vytipování potenciálních pluginů."""
-        self._plugin_identifiers.append(plugin_ident)
+        self._plugin_identifiers += (plugin_ident,)
 
     def add_all_identifiers(self, plugin_idents:
                             "Iterable[identifier.PluginIdentifier]"):
-        """Funkce přidá všechny dodané identifikátory."""
-        for i in plugin_idents:
-            self.add_identifier(i)
+        """Funkce přidá všechny dodané identifikátory. Je-li dodána ntice a
+        evidence je zatím prázdná, je ntice převzata přímo bez kopírování."""
+        if not self._plugin_identifiers and type(plugin_idents) is tuple:
+            self._plugin_identifiers = plugin_idents
+        else:
+            self._plugin_identifiers += tuple(plugin_idents)
 
     def add_validator(self, plugin_validator: "validator.PluginValidator"):
         """Funkce přidává validátor pluginů, který bude použit pro ověření
         správnosti a použitelnosti pluginu v daném kontextu."""
-        self._plugin_validators.append(plugin_validator)
+        self._plugin_validators += (plugin_validator,)
 
     def add_all_validators(self, plugin_validators:
                            "Iterable[validator.PluginValidator]"):
-        """Funkce přidá všechny dodané identifikátory."""
-        for v in plugin_validators:
-            self.add_validator(v)
+        """Funkce přidá všechny dodané validátory. Je-li dodána ntice a
+        evidence je zatím prázdná, je ntice převzata přímo bez kopírování."""
+        if not self._plugin_validators and type(plugin_validators) is tuple:
+            self._plugin_validators = plugin_validators
+        else:
+            self._plugin_validators += tuple(plugin_validators)
 
     def violated_identifiers(
             self, abs_path: str) -> "tuple[identifier.PluginIdentifier]":
@@ -212,18 +212,18 @@ class DefaultClassBasedProgramLoader(ProgramLoader):
 
     """Výchozí identifikátory pluginů, které jsou používány pro vytipování
     pluginů v kontextu programů."""
-    _DEFAULT_IDENTIFIERS = [
+    _DEFAULT_IDENTIFIERS = (
 
         # Zdrojové soubory musí mít koncovku '.py'
         pl_identifier.ExtensionPluginIdentifier(".py"),
 
         # Zdrojové soubory musí začínat řetězcem 'unit_'
         pl_identifier.PrefixPluginIdentifier("program_")
-    ]
+    )
 
     """Výchozí validátory pluginů, které jsou používány pro ověření platnosti
     a správnosti pluginů v kontextu programů."""
-    _DEFAULT_VALIDATORS = [
+    _DEFAULT_VALIDATORS = (
 
         # Modul musí být syntakticky validní
         pl_validator.SyntaxValidator(),
@@ -237,7 +237,7 @@ class DefaultClassBasedProgramLoader(ProgramLoader):
         # Modul musí obsahovat funkci vracející hodnotu konkrétního typu
         pl_validator.FunctionReturnValueTypeValidator(
             _ACCESS_FUN, program_module.AbstractProgram)
-    ]
+    )
 
     def __init__(self, assignment_name: str):
         """Initor třídy, který přijímá název zadání, které je reprezentováno
@@ -273,7 +273,7 @@ class DefaultFunBasedProgramLoader(ProgramLoader):
 
     """Výchozí identifikátory pluginů, které jsou používány pro vytipování
     pluginů v kontextu programů."""
-    _DEFAULT_IDENTIFIERS = [
+    _DEFAULT_IDENTIFIERS = (
 
         # Zdrojové soubory musí mít koncovku '.py'
         pl_identifier.ExtensionPluginIdentifier(".py"),
@@ -283,11 +283,11 @@ class DefaultFunBasedProgramLoader(ProgramLoader):
 
         # Zdrojové soubory musí mít maximálně 100 kB
         pl_identifier.MaxFilesizePluginIdentifier(102400)
-    ]
+    )
 
     """Výchozí validátory pluginů, které jsou používány pro ověření platnosti
     a správnosti pluginů v kontextu programů."""
-    _DEFAULT_VALIDATORS = [
+    _DEFAULT_VALIDATORS = (
 
         # Modul musí být syntakticky validní
         pl_validator.SyntaxValidator(),
@@ -318,7 +318,7 @@ class DefaultFunBasedProgramLoader(ProgramLoader):
             "Author Name Validator",
             f"Kontrola, že má modul definováno jméno autora v atributu "
             f"'{_AUTHOR_NAME}' o délce alespoň 4 znaků.")
-    ]
+    )
 
     def __init__(self, assignment_name: str):
         """Initor, který přijímá název zadání a připravuje loader vybavený
@@ -32,18 +32,18 @@ _ACCESS_FUN = "get_runtime_factory"
 
 """Výchozí identifikátory pluginů, které jsou používány pro vytipování
 pluginů v kontextu běhových prostředí."""
-_DEFAULT_IDENTIFIERS = [
+_DEFAULT_IDENTIFIERS = (
 
     # Zdrojové soubory musí mít koncovku '.py'
     pl_identifier.ExtensionPluginIdentifier(".py"),
 
     # Zdrojové soubory musí začínat řetězcem 'runtime_'
     pl_identifier.PrefixPluginIdentifier("runtime_")
-]
+)
 
 """Výchozí validátory pluginů, které jsou používány pro ověření platnosti
 a správnosti pluginů v kontextu továren běhových prostředí."""
-_DEFAULT_VALIDATORS = [
+_DEFAULT_VALIDATORS = (
 
     # Modul musí být syntakticky validní
     pl_validator.SyntaxValidator(),
@@ -57,7 +57,7 @@ _DEFAULT_VALIDATORS = [
     # Modul musí obsahovat funkci vracející hodnotu konkrétního typu
     pl_validator.FunctionReturnValueTypeValidator(
         _ACCESS_FUN, runtime_module.AbstractRuntimeFactory)
-]
+)
 
 
 class RuntimeFactoryLoader(loader_module.PluginLoader):
@@ -140,6 +140,8 @@ class RuntimeFactoryPlugin(plugin_module.Plugin):
     V rámci kontextového způsobu použití lze mluvit o třídě podle návrhového
     vzoru Služebník."""
 
+    __slots__ = ("_access_point_function",)
+
     def __init__(self, abs_path: str,
                  plugin_loader: "RuntimeFactoryLoader",
                  access_point_fun: str):
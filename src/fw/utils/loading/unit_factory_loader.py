@@ -34,18 +34,18 @@ _ABSOLUTE_UNIT_PLUGINS_DIR_PATH = join_paths(plugin_path(), _UNITS_DIR_NAME)
 
 """Výchozí identifikátory pluginů, které jsou používány pro vytipování
 pluginů v kontextu továren jednotek."""
-_DEFAULT_IDENTIFIERS = [
+_DEFAULT_IDENTIFIERS = (
 
     # Zdrojové soubory musí mít koncovku '.py'
     pl_identifier.ExtensionPluginIdentifier(".py"),
 
     # Zdrojové soubory musí začínat řetězcem 'unit_'
     pl_identifier.PrefixPluginIdentifier("unit_")
-]
+)
 
 """Výchozí validátory pluginů, které jsou používány pro ověření platnosti
 a správnosti pluginů v kontextu továren jednotek."""
-_DEFAULT_VALIDATORS = [
+_DEFAULT_VALIDATORS = (
 
     # Modul musí být syntakticky validní
     pl_validator.SyntaxValidator(),
@@ -59,7 +59,7 @@ _DEFAULT_VALIDATORS = [
     # Modul musí obsahovat funkci vracející hodnotu konkrétního typu
     pl_validator.FunctionReturnValueTypeValidator(
         _ACCESS_FUN, unit_module.AbstractUnitFactory)
-]
+)
 
 
 class UnitFactoryLoader(loader_module.PluginLoader):
@@ -92,8 +92,7 @@ class UnitFactoryLoader(loader_module.PluginLoader):
     def unit_factories(self) -> "tuple[unit_module.AbstractUnitFactory]":
         """Funkce obsluhuje načítání všech továrních tříd jednotek. Tyto
         načtené továrny pak vrací v podobě ntice."""
-        return tuple(map(lambda valid_plugin:
-                         valid_plugin.unit_factory, self.load()))
+        return tuple([plugin.unit_factory for plugin in self.load()])
 
     @property
     def not_valid_plugins(self) -> "tuple[UnitFactoryPlugin]":
@@ -141,6 +140,8 @@ class UnitFactoryPlugin(plugin_module.Plugin):
     V rámci kontextového způsobu použití lze mluvit o třídě podle návrhového
     vzoru Služebník."""
 
+    __slots__ = ("_access_point_function",)
+
     def __init__(self, abs_path: str,
                  plugin_loader: "UnitFactoryLoader",
                  access_point_fun: str):
@@ -4,21 +4,65 @@ běžného pozorování průběhu systému."""
 
 # Import standardních knihoven
 from datetime import datetime
+from time import time_ns
+from typing import Iterable, TYPE_CHECKING
+import sys
 
 # Import lokálních knihoven
 import src.fw.utils.timeworks as timeworks
 import src.fw.utils.logging.logging_output as output_module
-import src.fw.utils.logging.logger_pipeline as pipeline_module
 import src.fw.target.event_handling as event_module
-import src.fw.utils.logging.logging_events as logging_events
 
 from src.fw.utils.identifiable import Identifiable
 
+# Import pouze pro typové anotace; za běhu je modul importován lokálně
+if TYPE_CHECKING:
+    import src.fw.utils.logging.logger_pipeline as pipeline_module
+
+
+"""Evidence internovaných názvů kontextů. Kontextů je v systému jen několik,
+všechny logy i výstupy tak sdílí tytéž instance řetězců a porovnání je
+typicky rozhodnuto již shodou identity."""
+_CONTEXT_INTERN: "dict[str, str]" = {}
+
+
+def intern_context(context: str) -> str:
+    """Funkce vrací internovanou podobu dodaného názvu kontextu. Ten musí
+    být již v kapitálkách."""
+    interned = _CONTEXT_INTERN.get(context)
+    if interned is None:
+        interned = _CONTEXT_INTERN.setdefault(context, sys.intern(context))
+    return interned
+
+
+"""Paměť kanonických podob kontextů; pro libovolně zapsaný název kontextu
+uchovává jeho internovanou podobu v kapitálkách."""
+_CANONICAL_CONTEXTS: "dict[str, str]" = {}
+
+
+def canonical_context(context: str) -> str:
+    """Funkce vrací kanonickou podobu dodaného názvu kontextu, tedy podobu
+    v kapitálkách a internovanou. Převod je pro každý název proveden pouze
+    jednou, další volání jsou jen vyhledáním ve slovníku."""
+    canonical = _CANONICAL_CONTEXTS.get(context)
+    if canonical is None:
+        canonical = intern_context(context.upper())
+        _CANONICAL_CONTEXTS[context] = canonical
+    return canonical
+
 
 class Log(Identifiable):
     """Instance třídy Log mají za cíl obalit důležité informace okolo logu.
     Jejich cílem je uchovat především zprávu, stejně jako uchovat časový
-    bod, ve kterém zpráva vznikla, stejně jako její kontext."""
+    bod, ve kterém zpráva vznikla, stejně jako její kontext.
+
+    Kontext logu je vždy v kanonické podobě (v kapitálkách a internovaný),
+    výstupy jej tedy již dále nepřevádí."""
+
+    # Log vzniká pro každou zprávu; sloty šetří paměť i přístup k atributům.
+    # Slot pro identifikátor předka je deklarován zde (viz Identifiable)
+    __slots__ = ("_Identifiable__id", "_ts_ns", "_timestamp", "_time",
+                 "_date", "_context", "_message")
 
     def __init__(self, context: str, message: str):
         """Initor, který přijímá kontext a text zprávy. Kontext není
@@ -28,9 +72,30 @@ class Log(Identifiable):
         označení časového bodu, ve kterém instance vznikla."""
 
         Identifiable.__init__(self)
-
-        self._timestamp = datetime.now()
-        self._context = context.upper()
+        self._setup(canonical_context(context), message)
+
+    @classmethod
+    def from_canonical(cls, context: str, message: str) -> "Log":
+        """Alternativní konstruktor, který přijímá kontext již v kapitálkách.
+        Na rozdíl od initoru jej tedy znovu nepřevádí, čehož lze využít
+        především při logování z pipeline, která si kontext v kapitálkách
+        uchovává."""
+        log = cls.__new__(cls)
+        Identifiable.__init__(log)
+        log._setup(context, message)
+        return log
+
+    def _setup(self, context: str, message: str):
+        """Pomocná funkce, která nastaví časový bod vzniku logu a uloží
+        dodaný (již kanonický) kontext a zprávu.
+
+        Časový bod je uložen jen jako počet nanosekund; instance 'datetime'
+        i jeho textové reprezentace jsou vytvořeny až při prvním přístupu."""
+        self._ts_ns = time_ns()
+        self._timestamp = None
+        self._time = None
+        self._date = None
+        self._context = context
         self._message = message
 
     @property
@@ -46,7 +111,13 @@ class Log(Identifiable):
     @property
     def timestamp(self) -> datetime:
         """Vlastnost vrací instanci typu 'datetime', která reprezentuje časový
-        bod, kdy vznikl daný log."""
+        bod, kdy vznikl daný log.
+
+        Instance je vytvořena až při prvním přístupu a následně uchována."""
+        if self._timestamp is None:
+            seconds, nanoseconds = divmod(self._ts_ns, 1_000_000_000)
+            self._timestamp = datetime.fromtimestamp(seconds).replace(
+                microsecond=nanoseconds // 1000)
         return self._timestamp
 
     @property
@@ -55,7 +126,9 @@ class Log(Identifiable):
         časové podmnožiny), kdy log vznikl.
 
         Výsledný řetězec odpovídá plnému formátu, tedy 'HH:MM:SS.ffffff'."""
-        return timeworks.time(self.timestamp, True)
+        if self._time is None:
+            self._time = timeworks.time(self.timestamp, True)
+        return self._time
 
     @property
     def date(self) -> str:
@@ -63,7 +136,9 @@ class Log(Identifiable):
         datumové podmnožiny), kdy log vznikl.
 
         Výsledný řetězec odpovídá defaultnímu formátu, tedy 'DD-MM-YY'."""
-        return timeworks.date(self.timestamp)
+        if self._date is None:
+            self._date = timeworks.date(self.timestamp)
+        return self._date
 
     def __str__(self) -> str:
         return f"LOG({self.date=}, {self.context=}, {self.message=})"
@@ -78,15 +153,18 @@ class Logger(event_module.EventEmitter):
 
     def __init__(self):
         """Initor třídy, který je odpovědný za iniciaci evidence výstupních
-        loggovacích zpracovatelů. Tato evidence je v úvodu prázdná."""
+        loggovacích zpracovatelů. Tato evidence je v úvodu prázdná.
+
+        Evidence je slovník indexovaný identitou výstupu; zachovává pořadí
+        registrace a umožňuje přidání i odebrání v konstantním čase."""
         event_module.EventEmitter.__init__(self)
-        self._outputs: "list[output_module.LoggingOutput]" = []
+        self._outputs: "dict[int, output_module.LoggingOutput]" = {}
 
     @property
     def outputs(self) -> "tuple[output_module.LoggingOutput]":
         """Vlastnost vrací množinu všech výstupních logovacích zpracovatelů
         v podobě ntice."""
-        return tuple(self._outputs)
+        return tuple(self._outputs.values())
 
     def make_pipeline(self, context: str) -> "pipeline_module.LoggerPipeline":
         """Funkce vrací pro dodaný kontext novou pipeline loggeru, která mu
@@ -96,50 +174,97 @@ class Logger(event_module.EventEmitter):
         a stanovit použití konkrétního kontextu pro dané části programu, které
         danou funkcionalitu vyžadují.
         """
+        # Lokální import pro odložení načtení modulu až do prvního použití
+        import src.fw.utils.logging.logger_pipeline as pipeline_module
+
         return pipeline_module.LoggerPipeline(self, context)
 
     def add_output(self, output: "output_module.LoggingOutput"):
         """Funkce přidá nového výstupního logovacího zpracovatele do evidence.
+        Opakované přidání téže instance nemá žádný efekt.
         """
-        self._outputs.append(output)
+        self._outputs[id(output)] = output
 
     def remove_output(self, output: "output_module.LoggingOutput"):
         """Funkce odstraňuje dodaného výstupního logovacího zpracovatele z
-        evidence."""
-        self._outputs.remove(output)
+        evidence. Není-li evidován, nic se nestane."""
+        self._outputs.pop(id(output), None)
 
     def clear(self) -> "tuple[output_module.LoggingOutput]":
         """Funkce odstraňuje všechny logovací výstupní zpracovatele z
         evidence. Množinu (konkrétně ntici) doposud evidovaných však vrací.
         """
         outputs = self.outputs
-        self._outputs: "list[output_module.LoggingOutput]" = []
+        self._outputs: "dict[int, output_module.LoggingOutput]" = {}
         return outputs
 
     def log(self, context: str, message: str):
         """Funkce se postará o zalogování dodané zprávy v daném kontextu.
         Funkce vytvoří instanci logu z dodaných vstupů a tuto pak předá všem
         výstupním zpracovatelům k vytvoření výstupu."""
+        self._log_precanonical(canonical_context(context), message)
 
-        # Očištění zprávy; z konce jsou odstraněny všechny bílé znaky
-        message = message.rstrip()
+    def _log_precanonical(self, context: str, message: str):
+        """Interní varianta funkce 'log', která přijímá kontext již převedený
+        na kapitálky a internovaný. Využívají ji pipeline loggeru, které si
+        kontext v kapitálkách uchovávají, a není jej tak třeba převádět
+        znovu."""
 
-        # Formální kontrola zprávy; pokud je její délka po odříznutí koncových
-        # bílých znaků větší než 0, lze zprávu zalogovat, jinak je nahrazena
-        # defaultní "prázdnou" zprávou
-        if len(message) == 0:
-            message = "« empty message »"
-
-        # Tvorba instance třídy Log
-        log_instance = Log(context, message)
+        # Tvorba instance třídy Log z očištěné zprávy
+        log_instance = Log.from_canonical(
+            context, self._clean_message(message))
 
         # Pro každý výstup: je-li odpovědný za tento typ logu, zaloguj ho
-        for output in self.outputs:
-            if output.is_responsible_for(log_instance):
-                output.log(log_instance)
-
-        # Vytvoření události a upozornění všech registrovaných odběratelů
-        self.notify_all_event_handlers(
-            logging_events.LogEvent(log_instance))
+        for output in self._outputs.values():
+            output.try_log(log_instance)
+
+        # Vytvoření události a upozornění všech registrovaných odběratelů;
+        # nejsou-li žádní, událost se vůbec nevytváří
+        if self.has_any_event_handler:
+
+            # Lokální import pro prevenci cyklického importu
+            # (logging_events importuje tento modul)
+            import src.fw.utils.logging.logging_events as logging_events
+
+            self.notify_all_event_handlers(
+                logging_events.LogEvent(log_instance))
+
+    def log_batch(self, context: str, messages: "Iterable[str]"):
+        """Funkce se postará o zalogování všech dodaných zpráv v daném
+        kontextu. Výsledek je stejný jako při postupném volání funkce 'log',
+        kontext je však převeden jen jednou a každý výstup obdrží všechny
+        logy najednou (viz funkce 'log_batch' výstupů)."""
+        context = canonical_context(context)
+        logs = [Log.from_canonical(context, self._clean_message(message))
+                for message in messages]
+
+        # Bez zpráv není co logovat
+        if not logs:
+            return
+
+        # Předání všech logů každému výstupu najednou
+        for output in self._outputs.values():
+            output.log_batch(logs)
+
+        # Upozornění všech registrovaných odběratelů na každý z logů
+        if self.has_any_event_handler:
+
+            # Lokální import pro prevenci cyklického importu
+            # (logging_events importuje tento modul)
+            import src.fw.utils.logging.logging_events as logging_events
+
+            for log_instance in logs:
+                self.notify_all_event_handlers(
+                    logging_events.LogEvent(log_instance))
+
+    @staticmethod
+    def _clean_message(message: str) -> str:
+        """Funkce vrací očištěnou zprávu; z konce jsou odstraněny všechny
+        bílé znaky. Pokud je její délka po odříznutí koncových bílých znaků
+        nulová, je nahrazena defaultní "prázdnou" zprávou."""
+        message = message.rstrip()
+        if len(message) == 0:
+            message = "« empty message »"
+        return message
 
 
@@ -23,6 +23,9 @@ class LoggerPipeline:
     obdrží pouze funkci 'log(str)'.
     """
 
+    # Pevná sada atributů; název '__logger' je v rámci slotů také mangled
+    __slots__ = ("__logger", "_context")
+
     def __init__(self, logger: "logger_module.Logger", context: str):
         """Initor, který přijímá instanci loggeru, do kterého bude logováno,
         a textový řetězec, který značí stanovený kontext, v jakém bude
@@ -35,8 +38,8 @@ class LoggerPipeline:
         # 'Privátní' logger; totální soukromí nelze zcela zajistit
         self.__logger = logger
 
-        # Uložení kontextu v kapitálkách
-        self._context = context.upper()
+        # Uložení kontextu v kapitálkách (internovaného)
+        self._context = logger_module.canonical_context(context)
 
     @property
     def context(self) -> str:
@@ -50,5 +53,10 @@ class LoggerPipeline:
         použít například takto:
             >>> log('3+5=', 3 + 5)
         """
-        self.__logger.log(self._context, " ".join(map(str, message)))
+        # Nejčastěji je dodán jediný textový řetězec; ten není třeba spojovat
+        if len(message) == 1 and type(message[0]) is str:
+            text = message[0]
+        else:
+            text = " ".join(map(str, message))
+        self.__logger._log_precanonical(self._context, text)
 
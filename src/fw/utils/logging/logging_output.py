@@ -5,19 +5,234 @@ definuje obecný protokol pro všechny výstupní loggery, konkrétně třídu
 
 
 # Import standardních knihoven
-from abc import ABC, abstractmethod
 from textwrap import fill
+from threading import Event, Lock, Thread, current_thread
+from typing import Iterable, Sequence
+import atexit
 import sys
+import time
 
 # Import lokálních knihoven
 import src.fw.utils.logging.logger as logger_module
 
 
-class LoggingOutput(ABC):
-    """Abstraktní třída LoggingOutput stanovuje obecný a závazný protokol pro
-    všechny své potomky, tedy výstupy loggerů. Především stanovuje nakládání
-    se správou kontextů logů, stejně jako funkci pro zalogování; tedy pověření
-    k výstupu."""
+"""Výchozí velikost bufferu výstupu na konzoli (ve znacích) a výchozí
+interval (v sekundách), po jehož uplynutí je buffer vždy vyprázdněn."""
+_DEFAULT_BUFFER_SIZE = 4096
+_DEFAULT_FLUSH_INTERVAL = 0.1
+
+"""Šířka řádku výpisu na konzoli a šířka sloupce s názvem kontextu"""
+_LINE_WIDTH = 100
+_CONTEXT_WIDTH = 8
+
+
+def _wrap_fixed(text: str, prefix: str, width: int) -> "str | None":
+    """Funkce zalomí dodaný text na řádky o maximální šířce 'width', přičemž
+    první řádek je uvozen prefixem a další řádky odsazeny o jeho délku.
+
+    Text je dělen pouze v jednotlivých mezerách (pomocí 'rfind'), proto je
+    funkce použitelná jen pro texty bez bílých znaků kromě jednotlivých mezer
+    uvnitř textu, bez spojovníků a se slovy, která se vejdou na řádek. Pro
+    takové texty je výsledek shodný s funkcí 'textwrap.fill'. Pro ostatní
+    texty funkce vrací None."""
+
+    # Texty, které by 'fill' zpracovala jinak než prostým dělením v mezerách
+    if (not text or not text.isprintable() or "-" in text or
+            "  " in text or text[0] == " " or text[-1] == " "):
+        return None
+
+    available = width - len(prefix)
+    lines = []
+    rest = text
+    while len(rest) > available:
+        split_at = rest.rfind(" ", 0, available + 1)
+
+        # Slovo delší než řádek by muselo být rozděleno
+        if split_at <= 0:
+            return None
+        lines.append(rest[:split_at])
+        rest = rest[split_at + 1:]
+    lines.append(rest)
+
+    return prefix + ("\n" + len(prefix) * " ").join(lines)
+
+
+class ConsoleWriter:
+    """Instance této třídy zapisují textové výstupy přímo na standardní
+    výstup, bez vlastního bufferu. Pořadí výpisů je tak shodné s přímými
+    výpisy (např. funkcí 'print') programů robotů i výpisy chyb.
+
+    Standardní výstup je vyhledáván až v okamžiku zápisu, aby bylo
+    respektováno jeho případné přesměrování."""
+
+    __slots__ = ()
+
+    def write(self, text: str):
+        """Funkce zapíše dodaný text na standardní výstup."""
+        sys.stdout.write(text)
+
+    def flush(self):
+        """Funkce vyprázdní standardní výstup."""
+        sys.stdout.flush()
+
+
+class BufferedConsoleWriter:
+    """Instance této třídy shromažďují textové výstupy určené pro standardní
+    výstup a zapisují je hromadně. Místo zápisu pro každý jednotlivý log
+    je tak zápis proveden až po naplnění bufferu, po uplynutí stanoveného
+    intervalu, na explicitní žádost nebo při ukončování programu.
+
+    Všechna vlákna zapisují do jediného sdíleného bufferu, a to pod zámkem;
+    záznamy jsou tak vypsány přesně v pořadí, v jakém byly zapsány, a
+    průběžná velikost bufferu odpovídá jeho obsahu.
+
+    Standardní výstup je vyhledáván až v okamžiku zápisu, aby bylo
+    respektováno jeho případné přesměrování."""
+
+    def __init__(self, buffer_size: int = _DEFAULT_BUFFER_SIZE,
+                 flush_interval: float = _DEFAULT_FLUSH_INTERVAL):
+        """Initor, který přijímá velikost bufferu (ve znacích) a interval
+        (v sekundách), po kterém je buffer vždy vyprázdněn."""
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._records: "list[str]" = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+        self._lock = Lock()
+        self._flusher: "Thread | None" = None
+        self._stop_flusher: "Event | None" = None
+
+        # Po ukončení (viz funkce 'close' a '_shutdown') je zapisováno
+        # přímo, bez bufferu
+        self._closed = False
+        self._exit_hook_registered = False
+
+    @property
+    def buffer_size(self) -> int:
+        """Velikost bufferu ve znacích, po jejímž dosažení je zapisováno."""
+        return self._buffer_size
+
+    @property
+    def flush_interval(self) -> float:
+        """Interval v sekundách, po jehož uplynutí je buffer vyprázdněn."""
+        return self._flush_interval
+
+    def write(self, text: str):
+        """Funkce přidá dodaný text do bufferu. Je-li buffer plný nebo od
+        posledního zápisu uplynul stanovený interval, je buffer vyprázdněn.
+        """
+        with self._lock:
+            if self._closed:
+                out = sys.stdout
+                out.write(text)
+                out.flush()
+                return
+
+            self._records.append(text)
+            self._size += len(text)
+
+            if (self._size >= self._buffer_size or
+                    time.monotonic() - self._last_flush >=
+                    self._flush_interval):
+                self._flush_locked()
+
+            if self._flusher is None:
+                self._start_flusher()
+
+    def flush(self):
+        """Funkce zapíše obsah bufferu na standardní výstup, a to v pořadí,
+        v jakém byly záznamy zapsány."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Funkce vyprázdní buffer; volající musí držet zámek."""
+        self._last_flush = time.monotonic()
+        records = self._records
+        if not records:
+            return
+        text = "".join(records)
+        records.clear()
+        self._size = 0
+
+        out = sys.stdout
+        out.write(text)
+        out.flush()
+
+    def stop(self):
+        """Funkce zastaví vlákno pravidelného vyprazdňování (pokud běží) a
+        synchronně vyprázdní buffer. Při dalším zápisu je vlákno opět
+        spuštěno. Je vhodné ji volat před přímým tiskem na standardní
+        výstup."""
+        with self._lock:
+            flusher, stop_flusher = self._flusher, self._stop_flusher
+            self._flusher = self._stop_flusher = None
+
+        if flusher is not None:
+            stop_flusher.set()
+            if flusher is not current_thread():
+                flusher.join()
+
+        self.flush()
+
+    def close(self):
+        """Funkce zastaví vyprazdňování, vyprázdní buffer a přepne zapisovač
+        do režimu přímého zápisu; každý další text je tedy zapsán okamžitě.
+        """
+        self.stop()
+        with self._lock:
+            self._closed = True
+            self._flush_locked()
+
+    def _start_flusher(self):
+        """Funkce spustí vlákno pravidelného vyprazdňování a při prvním
+        spuštění zaregistruje ukončení zapisovače při ukončování programu;
+        volající musí držet zámek."""
+        if not self._exit_hook_registered:
+            atexit.register(self.close)
+            self._exit_hook_registered = True
+
+        self._stop_flusher = Event()
+        self._flusher = Thread(target=self._flush_periodically,
+                               args=(self._stop_flusher,), daemon=True)
+        self._flusher.start()
+
+    def _flush_periodically(self, stop_flusher: "Event"):
+        """Tělo vlákna (strašidla), které buffer pravidelně vyprazdňuje, aby
+        výstup nezůstal v bufferu ani při nečinnosti loggeru. Vlákno běží,
+        dokud není nastavena dodaná událost zastavení."""
+        while not stop_flusher.wait(self._flush_interval):
+            self.flush()
+
+
+"""Výchozí zapisovač na konzoli, který zapisuje přímo (bez bufferu)."""
+_DIRECT_WRITER = ConsoleWriter()
+
+"""Sdílený bufferovaný zapisovač na konzoli pro výstupy, které si bufferování
+zvolí; všechny takové výstupy sdílí tentýž buffer a vzájemné pořadí jejich
+záznamů je zachováno."""
+_CONSOLE_WRITER = BufferedConsoleWriter()
+
+
+def flush_printing_outputs():
+    """Funkce synchronně vyprázdní sdílený buffer bufferovaných výstupů na
+    konzoli (viz parametr 'buffered' výstupu PrintingOutput) a zastaví jeho
+    vlákno pravidelného vyprazdňování (při dalším zápisu je spuštěno znovu).
+    Je nutné ji volat před přímým tiskem na standardní výstup, aby bylo
+    zachováno pořadí výpisů."""
+    _CONSOLE_WRITER.stop()
+
+
+class LoggingOutput:
+    """Třída LoggingOutput stanovuje obecný a závazný protokol pro všechny své
+    potomky, tedy výstupy loggerů. Především stanovuje nakládání se správou
+    kontextů logů, stejně jako funkci pro zalogování; tedy pověření k výstupu.
+
+    Třída je zamýšlena jako abstraktní, není však postavena nad 'ABC'; tvorba
+    instancí tak nenese režii metatřídy. Neimplementované části protokolu
+    vyhazují výjimku NotImplementedError."""
+
+    __slots__ = ("_contexts", "_contexts_tuple", "_takes_all")
 
     def __init__(self, take_all: bool = False):
         """Initor třídy, který je odpovědný za připravení evidence kontextů
@@ -29,13 +244,15 @@ class LoggingOutput(ABC):
         bude tato defaultní hodnota překlopena na True, bude tento výstupní
         zpracovatel přijímat všechny kontexty.
         """
-        self._contexts: "list[str]" = []
+        self._contexts: "set[str]" = set()
+        self._contexts_tuple: "tuple[str]" = ()
         self._takes_all = take_all
 
     @property
     def contexts(self) -> "tuple[str]":
-        """Vlastnost vrací všechny evidované kontexty."""
-        return tuple(self._contexts)
+        """Vlastnost vrací všechny evidované kontexty. Ntice je uchovávána
+        a obnovena pouze při přidání nového kontextu."""
+        return self._contexts_tuple
 
     @property
     def takes_all(self) -> bool:
@@ -44,9 +261,11 @@ class LoggingOutput(ABC):
         return self._takes_all
 
     @property
-    @abstractmethod
     def has_memo(self) -> bool:
-        """Vlastnost vrací, zda-li má tento výstup loggeru paměť či nikoliv."""
+        """Vlastnost vrací, zda-li má tento výstup loggeru paměť či nikoliv.
+        Její implementace je na potomcích."""
+        raise NotImplementedError(
+            f"Třída '{type(self).__name__}' neimplementuje 'has_memo'")
 
     def has_context(self, context_name: str) -> bool:
         """Funkce vrací, zda-li má tento výstupní logger daný kontext evidován.
@@ -58,7 +277,10 @@ class LoggingOutput(ABC):
         Pokud je tato instance nastavena jako 'takes_all' (byl-li jí v initoru
         nastaven tento flag na hodnotu True), přijímá pak všechny kontexty
         a tedy vždy vrací hodnotu True."""
-        return self.takes_all or (context_name.upper() in self.contexts)
+        if self._takes_all:
+            return True
+        context = logger_module.canonical_context(context_name)
+        return context in self._contexts
 
     def is_responsible_for(self, log: "logger_module.Log") -> bool:
         """Funkce vrací, zda-li je tato instance odpovědná za zpracování
@@ -69,25 +291,47 @@ class LoggingOutput(ABC):
         nastaven tento flag na hodnotu True), přijímá pak všechny kontexty
         a tedy vždy vrací hodnotu True.
         """
-        return self.takes_all or self.has_context(log.context)
+        return self._takes_all or log.context in self._contexts
 
     def add_context(self, context_name: str):
         """Funkce je odpovědná za přidání nového kontextu do evidence.
         Pokud již jednou evidován je, již znovu přidáván není.
 
         Kontext je definován jako textový řetězec, tedy název. Tento název
-        je převáděn na kapitálky.
+        je převáděn na kapitálky a internován.
         """
-        if context_name.upper() not in self.contexts:
-            self._contexts.append(context_name.upper())
+        context_name = logger_module.canonical_context(context_name)
+        if context_name not in self._contexts:
+            self._contexts.add(context_name)
+            self._contexts_tuple += (context_name,)
+
+    def try_log(self, log: "logger_module.Log") -> bool:
+        """Funkce ověří, zda-li je tato instance odpovědná za zpracování
+        dodaného logu, a pokud ano, log rovnou zpracuje. Vrací, zda-li byl
+        log zpracován.
+
+        Příslušnost je tak ověřena jen jednou; funkce 'log' potomků ji pak
+        již znovu ověřovat nemusí."""
+        if self._takes_all or log.context in self._contexts:
+            self.log(log)
+            return True
+        return False
+
+    def log_batch(self, logs: "Sequence[logger_module.Log]"):
+        """Funkce zpracuje dávku logů; každý z nich, za který je tato
+        instance odpovědná. Výchozí implementace předává logy jednotlivě
+        funkci 'try_log', potomci ji mohou nahradit hromadným zpracováním."""
+        for log in logs:
+            self.try_log(log)
 
-    @abstractmethod
     def log(self, log: "logger_module.Log"):
-        """Abstraktní funkce definující protokol pomocí předepsání signatury
-        funkce. Implementace této funkce jsou odpovědné za vytvoření
+        """Funkce definující protokol pomocí předepsání signatury funkce.
+        Implementace této funkce v potomcích jsou odpovědné za vytvoření
         příslušného výstupu dle pravidel dané třídy.
 
         Funkce přijímá referenci na log, který by měl být zpracován."""
+        raise NotImplementedError(
+            f"Třída '{type(self).__name__}' neimplementuje funkci 'log'")
 
 
 class OutputWithMemo(LoggingOutput):
@@ -95,6 +339,8 @@ class OutputWithMemo(LoggingOutput):
     pro všechny své potomky, tedy výstupní zpracovatelé logů, které jsou si
     schopny zapamatovat (a udržet v paměti) dodané logy."""
 
+    __slots__ = ("_logs",)
+
     def __init__(self, take_all: bool = False):
         """Initor třídy, který postupuje dodanou informaci o univerzálním
         kontextu svému předkovi.
@@ -127,12 +373,27 @@ class OutputWithMemo(LoggingOutput):
         if self.is_responsible_for(log):
             self._logs.append(log)
 
+    def save_logs(self, logs: "Iterable[logger_module.Log]"):
+        """Funkce odpovědná za hromadné uložení dodaných logů do evidence.
+        Stejně jako funkce 'save_log' ověřuje příslušnost; logy kontextů,
+        za které tato instance odpovědná není, přidány nejsou.
+
+        Oproti opakovanému volání funkce 'save_log' jsou logy vyfiltrovány
+        v jediném průchodu a do evidence přidány najednou."""
+        if self._takes_all:
+            self._logs.extend(logs)
+        else:
+            contexts = self._contexts
+            self._logs.extend(
+                [log for log in logs if log.context in contexts])
+
     def filter_by_context(self, context: str) -> "tuple[logger_module.Log]":
         """Funkce, která poskytuje funkcionalitu filtrování podle dodaného
         kontextu. Název tohoto kontextu není case-sensitive; převádí se
-        defaultně na kapitálky."""
-        return tuple(filter(lambda log: log.context == context.upper(),
-                            self.remember))
+        defaultně na kapitálky. Cílový kontext je internován stejně jako
+        kontexty logů, porovnání je tak pouhým porovnáním referencí."""
+        target = logger_module.canonical_context(context)
+        return tuple([log for log in self._logs if log.context == target])
 
     def flush(self) -> "tuple[logger_module.Log]":
         """Funkce, která se postará o vyčištění evidence logů. Všechny doposud
@@ -141,25 +402,45 @@ class OutputWithMemo(LoggingOutput):
         self._logs: "list[logger_module.Log]" = []
         return logs
 
-    @abstractmethod
-    def log(self, log: "logger_module.Log"):
-        """Abstraktní funkce definující protokol pomocí předepsání signatury
-        funkce. Implementace této funkce jsou odpovědné za vytvoření
-        příslušného výstupu dle pravidel dané třídy.
 
-        Funkce přijímá referenci na log, který by měl být zpracován."""
+class PrintingOutput(LoggingOutput):
+    """Třída PrintingOutput je odpovědná za vypisování logů na konzoli.
 
+    Výpisy jsou ve výchozím stavu zapisovány přímo, aby jejich pořadí
+    odpovídalo přímým výpisům programů robotů. Bufferovaný zápis (viz
+    BufferedConsoleWriter) je volitelný."""
 
-class PrintingOutput(LoggingOutput):
-    """Třída PrintingOutput je odpovědná za vypisování logů na konzoli."""
+    __slots__ = ("_writer", "_ctx_pad")
 
-    def __init__(self, take_all: bool = True):
+    def __init__(self, take_all: bool = True,
+                 writer: "ConsoleWriter | BufferedConsoleWriter" = None,
+                 buffered: bool = False):
         """Initor, který přijímá informaci o tom, zda-li přijímat všechny
         kontexty či nikoliv.
 
         Pokud je nastavena tato defaultní hodnota na False, je třeba všechny
-        výstupní kontexty přidat do evidence posteriorně."""
+        výstupní kontexty přidat do evidence posteriorně.
+
+        Dále lze dodat zapisovač, kterým bude výstup zapisován. Není-li
+        dodán, je zapisováno přímo na konzoli, anebo (je-li nastaven příznak
+        'buffered') přes sdílený bufferovaný zapisovač; před přímým výpisem
+        na konzoli je pak nutné volat funkci 'flush_printing_outputs'."""
         LoggingOutput.__init__(self, take_all)
+        if writer is None:
+            writer = _CONSOLE_WRITER if buffered else _DIRECT_WRITER
+        self._writer = writer
+
+        # Paměť kontextů zarovnaných na šířku sloupce kontextu ve výpisu
+        self._ctx_pad: "dict[str, str]" = {}
+
+    @property
+    def writer(self) -> "ConsoleWriter | BufferedConsoleWriter":
+        """Zapisovač, kterým je výstup zapisován na konzoli."""
+        return self._writer
+
+    def flush(self):
+        """Funkce vyprázdní buffer zapisovače tohoto výstupu."""
+        self._writer.flush()
 
     @property
     def has_memo(self) -> bool:
@@ -168,19 +449,46 @@ class PrintingOutput(LoggingOutput):
 
     def log(self, log: "logger_module.Log"):
         """Funkce implementující protokol definovaný v předkovi. Funkce se
-        pouze stará o výpis v daném formátu."""
+        pouze stará o výpis v daném formátu.
 
-        prefix = f"[{log.time}][{log.context.ljust(8)}]: "
-        message = fill(log.message, width=100, initial_indent=prefix,
-                       subsequent_indent=len(prefix)*" ")
+        Zprávy, které se vejdou na jediný řádek a neobsahují žádné bílé znaky
+        kromě mezer (ani jimi nekončí), jsou vypsány přímo; výsledek je
+        shodný s výstupem funkce 'fill', ale bez jejího zalamování."""
 
-        sys.stdout.write(f"{message}\n")
+        context = log.context
+        pad = self._ctx_pad.get(context)
+        if pad is None:
+            pad = self._ctx_pad.setdefault(
+                context, context.ljust(_CONTEXT_WIDTH))
+
+        time = log.time
+        text = log.message
+
+        # Zpráva se vejde na řádek a zalamování by ji nijak nezměnilo; je
+        # vypsána jediným řetězcem. Prefix '[čas][kontext]: ' má délku
+        # časového razítka a kontextu zvětšenou o šest oddělovacích znaků
+        if (text and len(time) + len(pad) + 6 + len(text) <= _LINE_WIDTH and
+                text.isprintable() and text[-1] != " "):
+            self._writer.write(f"[{time}][{pad}]: {text}\n")
+            return
+
+        # Jinak je zpráva zalomena; obecná funkce 'fill' je použita jen
+        # tehdy, nelze-li zprávu zalomit prostým dělením v mezerách
+        prefix = f"[{time}][{pad}]: "
+        message = _wrap_fixed(text, prefix, _LINE_WIDTH)
+        if message is None:
+            message = fill(text, width=_LINE_WIDTH, initial_indent=prefix,
+                           subsequent_indent=len(prefix)*" ")
+
+        self._writer.write(f"{message}\n")
 
 
 class SimpleOutputWithMemo(OutputWithMemo):
     """Elementární funkce umožňující zaznamenávat jednotlivé logy ve své
     evidenci. Kromě jejich ukládání se nestará o nic jiného."""
 
+    __slots__ = ()
+
     def __init__(self, take_all: bool = False):
         """Initor, který pouze postupuje informaci o univerzálním přijímání
         záznamů do evidence."""
@@ -188,8 +496,16 @@ class SimpleOutputWithMemo(OutputWithMemo):
 
     def log(self, log: "logger_module.Log"):
         """Funkce, která implementuje protokol prapředka (LoggingOutput) a
-        stará se pouze o zaznamenání daného logu do evidence."""
-        self.save_log(log)
+        stará se pouze o zaznamenání daného logu do evidence.
+
+        Příslušnost logu zde již ověřována není; to zajišťuje funkce
+        'try_log', přes kterou logger výstupům logy předává."""
+        self._logs.append(log)
+
+    def log_batch(self, logs: "Sequence[logger_module.Log]"):
+        """Funkce přepisuje výchozí zpracování dávky logů; odpovídající logy
+        jsou do evidence přidány najednou (viz funkce 'save_logs')."""
+        self.save_logs(logs)
 
 
 
@@ -21,8 +21,14 @@ class Named(ABC):
 
     Důvodem je typicky pro člověka čitelný způsob popisu elementárního popisu
     instance.
+
+    Jediný atribut (název) je uložen ve slotu. Třída je tak kombinovatelná
+    s předky bez slotů (např. Described) i s předky s prázdnými sloty (např.
+    Identifiable).
     """
 
+    __slots__ = ("_name",)
+
     def __init__(self, name: str = "«no_name»"):
         """Jednoduchý initor odpovědný za přijetí názvu instance. Tento název
         nemusí být unikátní; dokonce může být nastaven automaticky. Defaultní
@@ -4,6 +4,7 @@ Základem je sdružení funkcí pro formátování času."""
 
 
 # Import standardních knihoven
+from typing import Callable
 import datetime
 
 
@@ -32,8 +33,15 @@ def time(timestamp: "datetime.datetime", include_ms: bool = True) -> str:
 
     Výsledek je typu str (textový řetězec) a odpovídá formátu:
     'HH:MM:SS.ffffff', resp. 'HH:MM:SS'.
+
+    Formátování je provedeno přímo z jednotlivých složek časového bodu,
+    bez interpretace formátovacího řetězce funkcí 'strftime'.
     """
-    return timestamp.strftime("%H:%M:%S.%f" if include_ms else "%H:%M:%S")
+    if include_ms:
+        return (f"{timestamp.hour:02d}:{timestamp.minute:02d}:"
+                f"{timestamp.second:02d}.{timestamp.microsecond:06d}")
+    return (f"{timestamp.hour:02d}:{timestamp.minute:02d}:"
+            f"{timestamp.second:02d}")
 
 
 def date(timestamp: "datetime.datetime",
@@ -43,6 +51,27 @@ def date(timestamp: "datetime.datetime",
     reprezentace.
 
     Datumový formát je defaultně nastaven; a to na podobu 'DD-MM-YY'.
+
+    Pro výchozí formáty definované v tomto modulu je použito přímé
+    formátování; ostatní formáty jsou zpracovány funkcí 'strftime'.
     """
+    formatter = _DATE_FORMATTERS.get(date_format)
+    if formatter is not None:
+        return formatter(timestamp)
     return timestamp.strftime(date_format)
 
+
+"""Přímé formátovače pro výchozí formáty datumů definované v tomto modulu"""
+_DATE_FORMATTERS: "dict[str, Callable[[datetime.datetime], str]]" = {
+    ISO_DATE_FORMAT:
+        lambda t: f"{t.year}-{t.month:02d}-{t.day:02d}",
+    DEFAULT_DATE_FORMAT_SHORT:
+        lambda t: f"{t.day:02d}.{t.month:02d}.{t.year % 100:02d}",
+    DEFAULT_DATE_FORMAT_SHORT_DASHED:
+        lambda t: f"{t.day:02d}-{t.month:02d}-{t.year % 100:02d}",
+    DEFAULT_DATE_FORMAT:
+        lambda t: f"{t.day:02d}.{t.month:02d}.{t.year}",
+    DEFAULT_DATE_FORMAT_DASHED:
+        lambda t: f"{t.day:02d}-{t.month:02d}-{t.year}",
+}
+
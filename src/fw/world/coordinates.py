@@ -2,91 +2,44 @@
 diskrétním prostorem, resp. jeho souřadnicovým systémem.
 
 Především pak definuje způsob, jakým lze uchovat hodnoty na osách x a y pro
-zobrazení bodu. Stejně tak obsahuje i posuvník v dodaném směru (podle definice
-v modulu 'direction.py'), dle kterého lze získat souřadnice bodu relativně
-vůči počátečnímu bodu a směru posunu.
+zobrazení bodu. Stejně tak obsahuje i schémata posunu v dodaném směru (podle
+definice v modulu 'direction.py'), dle kterých lze získat souřadnice bodu
+relativně vůči počátečnímu bodu a směru posunu.
 """
 
+# Import standardních knihoven
+from functools import lru_cache
+
+# Import lokálních knihoven
 from .direction import Direction
 from ..utils.error import PlatformError
 
 
-class DirectionMover:
-    """Třídy instance DirectionMover slouží k zjištění souřadnic bodu nového
-    z předcházejícího bodu a dodaného směru.
-
-    Instance této třídy toho docílí pomocí dodaného schématu posunu, tedy co
-    do inkrementu v jednotlivých osách pro dodané směry.
-
-    Aplikace je realizována podle návrhového vzoru Multiton, resp. Originál,
-    kde platí, že pro každý klíč existuje příslušná instance na tomto klíči
-    závislá.
-    """
+"""Slovník '_INCREMENTS' uchovává pro každý platný směr schéma posunu, tedy
+o kolik se při posunu v daném směru změní hodnota na ose x a na ose y.
+"""
+_INCREMENTS: "dict[Direction, tuple[int, int]]" = {
+    Direction.EAST: (1, 0),
+    Direction.NORTH: (0, 1),
+    Direction.WEST: (-1, 0),
+    Direction.SOUTH: (0, -1)
+}
 
-    """Schémata, kterých je používáno k zjištění, o kolik se v dané ose má
-    posunout. Důležitou složkou je vedle kombinace posunu v tom kterém směru
-    (zvýšení nebo snížení) pro danou osu (x nebo y) i směr, pro který jsou
-    tyto přírustky platné. Realizace je provedena slovníkem.
-    """
-    __schemas = {
-        Direction.EAST: (1, 0),
-        Direction.NORTH: (0, 1),
-        Direction.WEST: (-1, 0),
-        Direction.SOUTH: (0, -1)
-    }
-
-    def __init__(self, direction: "Direction"):
-        """Initor, který je schopen z dodaného směru za pomoci stanovených
-        schémat zjistit, v kterých osách se jak změní hodnota dané souřadnice,
-        a to z dodaného směru, ve kterém má být posunováno.
-        """
-        self._direction = direction
-        self._x_increment: int = DirectionMover.__schemas.get(direction)[0]
-        self._y_increment: int = DirectionMover.__schemas.get(direction)[1]
+"""Posuny na ose x a na ose y pro každý ze směrů indexované hodnotou směru
+(tedy v pořadí EAST, NORTH, WEST, SOUTH). Využívá je celočíselné rozhraní
+funkce 'neighbour_xy'."""
+_DX: "tuple[int, ...]" = (1, 0, -1, 0)
+_DY: "tuple[int, ...]" = (0, 1, 0, -1)
 
-    @property
-    def direction(self) -> "Direction":
-        """Vlastnost vrací směr, ve kterém je posouváno."""
-        return self._direction
 
-    @property
-    def x_incr(self) -> int:
-        """Vlastnost vrací inkrement v ose x při posunu v daném směru."""
-        return self._x_increment
+def neighbour_xy(x: int, y: int, direction_value: int) -> "tuple[int, int]":
+    """Funkce vrací souřadnice bodu posunutého z bodu [x, y] o jedno políčko
+    v daném směru. Na rozdíl od funkce 'move_in_direction' pracuje pouze
+    s celými čísly (směr je dán svou hodnotou) a nevytváří instance
+    souřadnic; je tak vhodná pro procházení prostoru v těsných smyčkách.
 
-    @property
-    def y_incr(self) -> int:
-        """Vlastnost vrací inkrement v ose y při posunu v daném směru."""
-        return self._y_increment
-
-
-"""Proměnná '_MOVERS' je sadou všech přípustných posuvníků, tedy pro každý
-platný směr jedna instance třídy 'DirectionMover'. Této proměnné je užíváno
-pro realizaci návrhového vzoru Multiton (Originál).
-"""
-_MOVERS = (
-    DirectionMover(Direction.EAST),
-    DirectionMover(Direction.NORTH),
-    DirectionMover(Direction.WEST),
-    DirectionMover(Direction.SOUTH)
-)
-
-
-def _get_mover(direction: "Direction") -> "DirectionMover":
-    """Funkce pro příslušný směr vyhledá správný posuvník. Využívá přitom
-    existující proměnné '_MOVERS', která pro všechny platné směry posuvník
-    uchovává.
-
-    Pokud není dodán validní směr (typicky hodnota None), je vyhozena výjimka
-    'CoordinatesError', která v tomto kontextu značí nenalezení příslušného
-    posuvníku a nelze tedy posun provést.
-    """
-    for mover in _MOVERS:
-        if mover.direction == direction:
-            return mover
-    raise CoordinatesError(
-        f"Pro dodaný směr '{direction}' nebyl žádný validní "
-        f"posuvník nalezen.")
+    Hodnota směru musí být v rozsahu 0 až 3; nijak se neověřuje."""
+    return x + _DX[direction_value], y + _DY[direction_value]
 
 
 class Coordinates:
@@ -107,6 +60,9 @@ class Coordinates:
     pokud zůstanou celočíselné.
     """
 
+    # Souřadnice vznikají při každém posunu; sloty šetří paměť i přístup
+    __slots__ = ("_x", "_y")
+
     def __init__(self, x: int, y: int):
         """Initor, který přijímá hodnoty 'x' a 'y' a které si uvnitř instance
         uloží a dále s nimi poskytuje definované služby.
@@ -118,6 +74,15 @@ class Coordinates:
         self._x = x
         self._y = y
 
+    @classmethod
+    @lru_cache(maxsize=8192)
+    def of(cls, x: int, y: int) -> "Coordinates":
+        """Tovární funkce vrací instanci souřadnic pro dodané hodnoty 'x' a
+        'y'. Instance jsou neměnné, proto jsou pro tytéž hodnoty sdíleny
+        (návrhový vzor Muší váha); opakované dotazy na tentýž bod tak
+        nevytváří nové instance."""
+        return cls(x, y)
+
     @property
     def x(self) -> int:
         """Vlastnost vrací souřadnici na ose x."""
@@ -133,6 +98,16 @@ class Coordinates:
         """Vlastnost vrací obě hodnoty ('x' a 'y') v podobě ntice."""
         return self.x, self.y,
 
+    def __eq__(self, other: object) -> bool:
+        """Dvě instance souřadnic jsou si rovny, shodují-li se v obou osách.
+        """
+        if isinstance(other, Coordinates):
+            return self._x == other._x and self._y == other._y
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._x, self._y))
+
     def move_in_direction(self, direction: "Direction") -> "Coordinates":
         """Funkce má za cíl podle návrhového vzoru Stav vrátit instanci té
         samé třídy s upravenými parametry.
@@ -141,11 +116,17 @@ class Coordinates:
         směru. Do parametru funkce je postoupen směr, ve kterém se takový bod
         má hledat. Je-li tento platným směrem, ve kterém se má posouvat, vždy
         funkce navrátí novou instanci této třídy po posunutí. Není-li dodaný
-        směr platný, je vyhozena výjimka 'CoordinatesError'; více ve funkci
-        '_get_mover(Direction)' v tomto modulu.
+        směr platný (typicky hodnota None), je vyhozena výjimka
+        'CoordinatesError'.
         """
-        dm = _get_mover(direction)
-        return Coordinates(self.x + dm.x_incr, self.y + dm.y_incr)
+        # Směr je IntEnum, proto je nutné vyloučit i prosté celé číslo
+        increment = (_INCREMENTS.get(direction)
+                     if isinstance(direction, Direction) else None)
+        if increment is None:
+            raise CoordinatesError(
+                f"Pro dodaný směr '{direction}' nebylo žádné validní "
+                f"schéma posunu nalezeno.")
+        return Coordinates.of(self._x + increment[0], self._y + increment[1])
 
 
 class CoordinatesError(PlatformError):
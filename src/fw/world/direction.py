@@ -4,10 +4,10 @@ strany a k nim příslušné metody vzájemně je propojující (co do otáčen
 """
 
 # Import standardních knihoven
-from enum import Enum
+from enum import IntEnum
 
 
-class Direction(Enum):
+class Direction(IntEnum):
     """Výčtový typ definující čtyři světové strany EAST, NORTH, WEST, SOUTH
     (v tomto pořadí).
     Každé z těchto čtyř instancí je přidělena sada metod operujících nad
@@ -15,6 +15,9 @@ class Direction(Enum):
     souseda po otočení o 90° doprava (otočení po směru hodinových ručiček) či
     doleva (otočení proti směru hodinových ručiček). Jde tedy o realizaci
     pomocí návrhového vzoru Stav.
+
+    Směry jsou celočíselným výčtem; jejich hodnoty tak lze přímo použít
+    jako indexy do předpočítaných tabulek otočení.
     """
     EAST, NORTH, WEST, SOUTH = range(4)
 
@@ -22,35 +25,29 @@ class Direction(Enum):
         """Metoda vrací směr reprezentující otočení o 90° proti směru
         hodinových ručiček. Příkladně pro NORTH bude vrácena instance WEST.
         """
-        return (Direction(self.value + 1) if self.value < 3
-                else Direction(0))
+        return self._left
 
     def turn_right(self) -> 'Direction':
         """Metoda vrací směr reprezentující otočení o 90° po směru
         hodinových ručiček. Příkladně pro NORTH bude vrácena instance EAST.
         """
-        return (Direction(self.value - 1) if self.value > 0
-                else Direction(3))
+        return self._right
 
     def about_face(self) -> 'Direction':
         """Metoda vrací směr reprezentující otočení o 180°. Příkladně pro
         NORTH bude vrácena instance SOUTH.
         """
-        return self.turn_right().turn_right()
+        return self._opposite
 
     def __str__(self) -> str:
         return self.name
 
     @staticmethod
-    def list() -> 'list[Direction]':
-        """Metoda vrací seznam směrů seřazených proti směru hodinových
-        ručiček počínaje východem."""
-        return [
-            Direction.EAST,
-            Direction.NORTH,
-            Direction.WEST,
-            Direction.SOUTH,
-        ]
+    def list() -> 'tuple[Direction, ...]':
+        """Metoda vrací ntici směrů seřazených proti směru hodinových
+        ručiček počínaje východem. Ntice je vytvořena jen jednou při importu
+        modulu a je vždy vracena tatáž."""
+        return _ALL
 
     @staticmethod
     def direction_by_name(direction_name: str) -> "Direction":
@@ -68,22 +65,68 @@ class Direction(Enum):
             -  a všechny výše uvedené řetězce v libovolném casingu
         """
 
-        # Převod názvu na kapitálky (pro jistotu)
-        direction_name = direction_name.upper()
-
-        # Pro každý směr ze všech směrů
-        for direction in Direction.list():
+        # Prázdný název nemůže odpovídat žádnému směru
+        if not direction_name:
+            return None
 
-            # Pokud se název směru nebo jeho první písmeno shoduje s dodaným
-            # názvem, pak tento směr vrať
-            if (direction.name == direction_name or
-                    direction.name[0] == direction_name):
-                return direction
+        # Vyhledání směru podle názvu převedeného na kapitálky
+        return _BY_NAME.get(direction_name.upper())
 
     @staticmethod
     def direction_names() -> "tuple[str]":
         """Funkce vrací názvy všech směrů."""
-        # Redundantní přetypování pro potřeby správné kontroly typů IDE,
-        # která mají problém s lambdami
-        return tuple(map(lambda d: str(d.name), Direction.list()))
+        return _NAMES
+
+
+def turn_left_value(direction_value: int) -> int:
+    """Funkce vrací hodnotu směru po otočení o 90° proti směru hodinových
+    ručiček. Pracuje pouze s celočíselnými hodnotami směrů (0 až 3) bez
+    tvorby instancí výčtového typu; je tak vhodná pro těsné smyčky."""
+    return (direction_value + 1) & 3
+
+
+def turn_right_value(direction_value: int) -> int:
+    """Funkce vrací hodnotu směru po otočení o 90° po směru hodinových
+    ručiček (viz funkce 'turn_left_value')."""
+    return (direction_value - 1) & 3
+
+
+def about_face_value(direction_value: int) -> int:
+    """Funkce vrací hodnotu směru po otočení o 180° (viz funkce
+    'turn_left_value')."""
+    return (direction_value + 2) & 3
+
+
+"""Ntice všech směrů seřazených proti směru hodinových ručiček počínaje
+východem a ntice jejich názvů."""
+_ALL: "tuple[Direction, ...]" = (
+    Direction.EAST, Direction.NORTH, Direction.WEST, Direction.SOUTH)
+
+_NAMES: "tuple[str, ...]" = tuple([direction.name for direction in _ALL])
+
+"""Slovník směrů podle jejich celého názvu i počátečního písmene."""
+_BY_NAME: "dict[str, Direction]" = {
+    **{direction.name: direction for direction in _ALL},
+    **{direction.name[0]: direction for direction in _ALL},
+}
+
+"""Předpočítané tabulky otočení. Pro každý směr (indexováno jeho hodnotou)
+uchovávají směr po otočení o 90° doleva, o 90° doprava a o 180°. Tabulky
+jsou odvozeny z celočíselných funkcí otočení, které hodnotu směru zalamují
+bitovou maskou (& 3) bez jakéhokoliv větvení."""
+_LEFT: "tuple[Direction, ...]" = tuple(
+    [Direction(turn_left_value(direction)) for direction in Direction])
+
+_RIGHT: "tuple[Direction, ...]" = tuple(
+    [Direction(turn_right_value(direction)) for direction in Direction])
+
+_OPPOSITE: "tuple[Direction, ...]" = tuple(
+    [Direction(about_face_value(direction)) for direction in Direction])
 
+# Cílové směry otočení jsou uloženy přímo jako atributy jednotlivých směrů;
+# otočení je tak pouhým čtením atributu
+for _direction in Direction:
+    _direction._left = _LEFT[_direction]
+    _direction._right = _RIGHT[_direction]
+    _direction._opposite = _OPPOSITE[_direction]
+del _direction
@@ -7,7 +7,7 @@ from abc import abstractmethod
 
 # Import lokálních knihoven
 from src.fw.utils.error import PlatformError
-from src.fw.world.coordinates import Coordinates
+from src.fw.world.coordinates import Coordinates, neighbour_xy
 from src.fw.world.direction import Direction
 
 import src.fw.world.mark as mark_module
@@ -30,8 +30,24 @@ class Field(rc_module.SingleRobotContainer, mark_module.Markable):
     Políčko je také svým způsobem kontejnerem robotů; v konkrétní implementaci
     chápeme jako kontejner jediného robota v daném okamžiku. Proto je také
     třída Field potomkem třídy SingleRobotContainer.
+
+    Políček je ve světě velké množství, proto jsou všechny atributy (včetně
+    atributů předků) uloženy ve slotech.
     """
 
+    __slots__ = ("_rules", "_mark", "_coordinates", "_world", "_neighbours",
+                 "_neighbour_table")
+
+    """Název typu políčka pro textovou reprezentaci. Každý potomek si jej
+    při své definici nastaví na název své třídy."""
+    _type_name: str = "Field"
+
+    def __init_subclass__(cls, **kwargs):
+        """Při definici potomka je uložen název jeho třídy, aby jej nebylo
+        nutné zjišťovat při každé tvorbě textové reprezentace."""
+        super().__init_subclass__(**kwargs)
+        cls._type_name = cls.__name__
+
     def __init__(self, x: int, y: int):
         """Initor políčka, který je odpovědný za nastavení defaultních hodnot,
         stejně jako je odpovědný za volání initorů svých předků.
@@ -41,13 +57,20 @@ class Field(rc_module.SingleRobotContainer, mark_module.Markable):
         mark_module.Markable.__init__(self)
 
         """Nastavení souřadnicového identifikátoru z dodaných hodnot."""
-        self._coordinates = Coordinates(x, y)
+        self._coordinates = Coordinates.of(x, y)
 
         """Reference na svět, ke kterému políčko náleží. Zprvu None; nastavena
         je až během životního cyklu instance. Zároveň tento svět může být
         nastaven maximálně jednou."""
         self._world = None
 
+        """Mezipaměť sousedů políčka. Sousedé jsou zjišťováni až při prvním
+        dotazu; do té doby (nebo po změně prostoru světa) je hodnota None.
+        Tabulka sousedů je indexována směrem a pro směry bez souseda
+        obsahuje hodnotu None."""
+        self._neighbours: "tuple[Field]" = None
+        self._neighbour_table: "tuple[Field]" = None
+
     @property
     @abstractmethod
     def is_wall(self) -> bool:
@@ -76,13 +99,13 @@ class Field(rc_module.SingleRobotContainer, mark_module.Markable):
     def x(self) -> int:
         """Vlastnost vrací hodnotu souřadnice na ose x, kde se políčko nachází.
         """
-        return self.coordinates.x
+        return self._coordinates.x
 
     @property
     def y(self) -> int:
         """Vlastnost vrací hodnotu souřadnice na ose y, kde se políčko nachází.
         """
-        return self.coordinates.y
+        return self._coordinates.y
 
     @property
     def world(self) -> "world_mod.World":
@@ -109,104 +132,122 @@ class Field(rc_module.SingleRobotContainer, mark_module.Markable):
         směrů (typicky 4).
 
         K tomu je zapotřebí reference na svět. Pokud tato není nastavena,
-        je vyhozena výjimka."""
-        if self.world is None:
-            raise FieldError(
-                f"Nelze zjistit sousedy, když není nastaven svět", self)
-        return self.world.neighbours(self.x, self.y)
+        je vyhozena výjimka. Sousedé jsou zjištěni (a podmínky ověřeny) jen
+        při prvním dotazu, a to z tabulky sousedů podle směrů; další dotazy
+        vrací uloženou ntici."""
+        neighbours = self._neighbours
+        if neighbours is None:
+            if self.world is None:
+                raise FieldError(
+                    f"Nelze zjistit sousedy, když není nastaven svět", self)
+            table = self._neighbour_table
+            if table is None:
+                table = self._build_neighbour_table()
+            neighbours = self._neighbours = tuple([
+                neighbour for neighbour in table if neighbour])
+        return neighbours
 
     def neighbour(self, direction: "Direction") -> "Field":
         """Funkce vrací referenci na políčko, které s tímto sousedí v daném
         směru."""
-        if self.world is None:
+
+        # Je-li již sestavena tabulka sousedů, stačí v ní souseda vyhledat;
+        # podmínky byly ověřeny při jejím sestavení
+        if isinstance(direction, Direction):
+            table = self._neighbour_table
+            if table is None:
+                table = self._build_neighbour_table()
+            return table[direction]
+
+        elif self.world is None:
             raise FieldError(
                 f"Nelze zjistit souseda, když není nastaven svět", self)
         elif direction is None:
             raise FieldError(
                 f"Dodaný směr nesmí být None", self)
-        # Vyhledání sousedního políčka dle dodaných sousedních souřadnic
+
+        # Jiné hodnoty než směry nejsou v tabulce sousedů; souřadnice
+        # souseda jsou ověřeny a vyhledány přímo
         return self.world.field(
             *self.coordinates.move_in_direction(direction).xy)
 
+    def _build_neighbour_table(self) -> "tuple[Field]":
+        """Funkce sestaví a uloží tabulku sousedů indexovanou směrem.
+        Souřadnice sousedů jsou spočítány z předpočítaných posunů bez tvorby
+        instancí souřadnic. Pokud není nastaven svět, je vyhozena výjimka."""
+        if self.world is None:
+            raise FieldError(
+                f"Nelze zjistit souseda, když není nastaven svět", self)
+        x, y = self._coordinates.x, self._coordinates.y
+        field = self._world.field
+        self._neighbour_table = tuple([
+            field(*neighbour_xy(x, y, d)) for d in Direction])
+        return self._neighbour_table
+
+    def reset_neighbours(self):
+        """Funkce zapomene uložené sousedy políčka; ti budou při dalším
+        dotazu zjištěni znovu. Využívá ji svět při změně svého prostoru."""
+        self._neighbours = None
+        self._neighbour_table = None
+
     def __str__(self) -> str:
         """Funkce vrací textovou reprezentaci políčka."""
-        return (f"{type(self).__name__} @ [{self.x}, {self.y}]"
-                f"{' ' + str(self.mark) if self.mark else ''}")
+        coordinates = self._coordinates
+        if self._mark is None:
+            return f"{self._type_name} @ [{coordinates.x}, {coordinates.y}]"
+        return (f"{self._type_name} @ [{coordinates.x}, {coordinates.y}] "
+                f"{self._mark}")
 
 
 class Wall(Field):
     """Reprezentace políčka ve světě, které není navštivitelné. Tato
     reprezentace stěny značí úmyslnou a nepřekonatelnou překážku ve světě.
 
-    Jde o políčko, které nelze navštívit (funkce vlastnosti 'can_go_to' vrací
+    Jde o políčko, které nelze navštívit (atribut 'can_go_to' má hodnotu
     False).
     """
 
+    __slots__ = ()
+
+    """Vlastnosti stěny jsou neměnné, proto jsou uloženy přímo jako atributy
+    třídy; stěna není cestou, nelze na ni vstoupit ani ji označkovat."""
+    is_wall = True
+    is_path = False
+    can_go_to = False
+    can_be_marked = False
+
     def __init__(self, x: int, y: int):
         """"""
         Field.__init__(self, x, y)
 
-    @property
-    def is_wall(self) -> bool:
-        """Abstraktní vlastnost vrací informaci o tom, zda-li je toto políčko
-        stěnou či nikoliv."""
-        return True
-
-    @property
-    def is_path(self) -> bool:
-        """Abstraktní vlastnost vrací informaci o tom, zda-li je toto políčko
-        cestou či nikoliv."""
-        return False
-
-    @property
-    def can_go_to(self) -> bool:
-        """Abstraktní vlastnost vrací informaci o tom, zda-li může robot
-        vstoupit na toto políčko."""
-        return False
-
-    @property
-    def can_be_marked(self) -> bool:
-        """Vlastnost vrací hodnotu False, neboť tato instance nemůže být
-        označkována."""
-        return False
+    def __str__(self) -> str:
+        """Funkce vrací textovou reprezentaci stěny. Stěna nemůže být
+        označkována, proto je vynechána značka."""
+        coordinates = self._coordinates
+        return f"{self._type_name} @ [{coordinates.x}, {coordinates.y}]"
 
 
 class Path(Field):
     """Reprezentace základního políčka, které lze navštívit. Jeho podstata
     je v průchodnosti a umožnění pohybu v prostoru světa.
 
-    Jeho průchodnosti a navštivitelnosti odpovídá i funkce obalená vlastností
-    'can_go_to', která vrací hodnotu True.
+    Jeho průchodnosti a navštivitelnosti odpovídá i atribut 'can_go_to',
+    který má hodnotu True.
     """
 
+    __slots__ = ()
+
+    """Vlastnosti cesty jsou neměnné, proto jsou uloženy přímo jako atributy
+    třídy; cesta není stěnou, lze na ni vstoupit i ji označkovat."""
+    is_wall = False
+    is_path = True
+    can_go_to = True
+    can_be_marked = True
+
     def __init__(self, x: int, y: int):
         """"""
         Field.__init__(self, x, y)
 
-    @property
-    def is_wall(self) -> bool:
-        """Abstraktní vlastnost vrací informaci o tom, zda-li je toto políčko
-        stěnou či nikoliv."""
-        return False
-
-    @property
-    def is_path(self) -> bool:
-        """Abstraktní vlastnost vrací informaci o tom, zda-li je toto políčko
-        cestou či nikoliv."""
-        return True
-
-    @property
-    def can_go_to(self) -> bool:
-        """Abstraktní vlastnost vrací informaci o tom, zda-li může robot
-        vstoupit na toto políčko."""
-        return True
-
-    @property
-    def can_be_marked(self) -> bool:
-        """Vlastnost vrací hodnotu True, neboť tato instance může být
-        označkována."""
-        return True
-
 
 class FieldError(PlatformError):
     """Výjimka 'FieldError' je obohacuje tu obecnou o referenci na políčko,
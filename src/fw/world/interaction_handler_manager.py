@@ -4,6 +4,7 @@ interakcí."""
 
 # Import standardních knihoven
 from abc import ABC, abstractmethod
+from threading import Lock
 
 # Import lokálních knihoven
 import src.fw.robot.interaction as inter_module
@@ -19,8 +20,20 @@ class InteractionHandlerManager(ABC):
         proměnných, tedy handlerů, které má správce evidovány. V úvodní
         fázi je evidence prázdná, tyto jsou dodávány až za běhu životního
         cyklu instance.
+
+        Handlery jsou evidovány ve slovníku podle typu interakce, za jejíž
+        zpracování jsou odpovědné; vyhledání handleru je tak jediným
+        dotazem do slovníku.
         """
-        self._handlers: "list[inter_module.InteractionHandler]" = []
+        self._handlers: "dict[type, inter_module.InteractionHandler]" = {}
+
+        """Neměnný snímek evidovaných handlerů v pořadí jejich přidání.
+        Je obnoven při každém přidání handleru."""
+        self._handlers_snapshot: "tuple[inter_module.InteractionHandler]" = ()
+
+        """Zámek chránící přidávání handlerů do evidence. Vyhledávání
+        handlerů evidenci pouze čte, a zámek proto nepoužívá."""
+        self._lock = Lock()
         self._interactions: "list[inter_module.Interaction]" = []
 
     @property
@@ -33,7 +46,7 @@ class InteractionHandlerManager(ABC):
     def interaction_handlers(self) -> "tuple[inter_module.InteractionHandler]":
         """Vlastnost vrací ntici všech handlerů, které má správce v evidenci.
         """
-        return tuple(self._handlers)
+        return self._handlers_snapshot
 
     def save_interaction(self, interaction: "inter_module.Interaction"):
         """Funkce zaregistruje dodanou interakci do evidence."""
@@ -45,22 +58,23 @@ class InteractionHandlerManager(ABC):
         Pokud již existuje jeden handler pro zpracování interakcí stejného
         typu je v evidenci obsažen, je vyhozena výjimka.
         """
-        for i_h in self.interaction_handlers:
-            if i_h.interaction_type is handler.interaction_type:
+        with self._lock:
+            if handler.interaction_type in self._handlers:
                 raise InteractionHandlerManagerError(
                     f"Nelze mít evidovány dva handlery pro stejný typ "
                     f"interakce: '{handler.interaction_type}'", self)
-        self._handlers.append(handler)
+            self._handlers[handler.interaction_type] = handler
+            self._handlers_snapshot = tuple(self._handlers.values())
 
     def has_interaction_handler(
             self, interaction: "inter_module.Interaction") -> bool:
         """Funkce se pokusí vyhledat handler odpovědný za zpracování interakcí
         daného typu. Pokud-že takový není nalezen, je vráceno False, jinak
-        True."""
-        for handler in self.interaction_handlers:
-            if handler.is_mine(interaction):
-                return True
-        return False
+        True.
+
+        Handler je odpovědný pouze za interakce přesně svého typu (viz
+        funkce 'is_mine'), proto stačí vyhledat typ interakce v evidenci."""
+        return type(interaction) in self._handlers
 
     def get_interaction_handler(self, interaction: "inter_module.Interaction"
                                 ) -> "inter_module.InteractionHandler":
@@ -71,12 +85,12 @@ class InteractionHandlerManager(ABC):
         pokus o podvod nebo chybně definované přidání požadovaných handlerů
         do evidence.
         """
-        for handler in self.interaction_handlers:
-            if handler.is_mine(interaction):
-                return handler
-        raise InteractionHandlerManagerError(
-            f"Pro interakci '{type(interaction)}' "
-            f"není handler evidován", self)
+        handler = self._handlers.get(type(interaction))
+        if handler is None:
+            raise InteractionHandlerManagerError(
+                f"Pro interakci '{type(interaction)}' "
+                f"není handler evidován", self)
+        return handler
 
     @abstractmethod
     def process_interaction(
@@ -10,7 +10,8 @@ from __future__ import annotations
 
 # Import standardních knihoven
 from abc import ABC, abstractmethod
-from typing import Iterable
+from threading import Lock
+from typing import Callable, Iterable
 
 # Import lokálních knihoven
 import src.fw.robot.interaction as interaction_module
@@ -26,8 +27,13 @@ class InteractionRule(ABC):
     a nepředchází nutně případným narušením integrity tohoto světa.
 
     Typickými pravidly je například omezení aplikovatelného počtu interakcí.
+
+    Pravidla jsou vyhodnocována pro každou interakci, proto jejich atributy
+    potomci uchovávají ve slotech; tato třída sama deklaruje prázdné sloty.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def check(self, interaction: "interaction_module.Interaction") -> bool:
         """Abstraktní funkce definuje způsob ověření, že je interakce z
@@ -39,6 +45,8 @@ class LimitedCounter(InteractionRule):
     všech aplikovaných interakcí. Pokud tento limitní počet je překročen,
     jsou další interakce zamítnuty."""
 
+    __slots__ = ("_num_of_allowed", "_current_state")
+
     def __init__(self, num_of_allowed: int = 100_000):
         """Initor, který přijímá maximální počet aplikovatelných interakcí.
 
@@ -48,8 +56,8 @@ class LimitedCounter(InteractionRule):
 
         Dále initor deklaruje aktuální stav (který je roven 0).
         """
-        self.__num_of_allowed = num_of_allowed
-        self.__current_state = 0
+        self._num_of_allowed = num_of_allowed
+        self._current_state = 0
 
         if self.num_of_allowed < 0:
             raise Exception(f"Nelze mít záporný počet povolených "
@@ -58,13 +66,13 @@ class LimitedCounter(InteractionRule):
     @property
     def num_of_allowed(self) -> int:
         """Vlastnost vrací horní limit povolených interakcí."""
-        return self.__num_of_allowed
+        return self._num_of_allowed
 
     @property
     def current_state(self) -> int:
         """Vlastnost vrací aktuální stav, tedy kolik interakcí bylo celkem
         aplikováno."""
-        return self.__current_state
+        return self._current_state
 
     @property
     def have_left(self) -> int:
@@ -76,9 +84,13 @@ class LimitedCounter(InteractionRule):
     def check(self, interaction: "interaction_module.Interaction") -> bool:
         """Funkce ověřující, že je počet doposud aplikovaných interakcí menší,
         než je stanovený limit. Pokud toto pravidlo naplněno není, vrací False.
+
+        Podmínka odpovídá kladné hodnotě vlastnosti 'have_left'; je však
+        vyhodnocena přímo nad atributy bez volání vlastností.
         """
-        self.__current_state += 1
-        return self.have_left > 0
+        current_state = self._current_state + 1
+        self._current_state = current_state
+        return current_state < self._num_of_allowed
 
 
 class LimitPerInteractionType(InteractionRule):
@@ -89,12 +101,17 @@ class LimitPerInteractionType(InteractionRule):
     'LimitCounter', které se zaměřuje na celkový počet všech interakcí.
     """
 
+    __slots__ = ("_num_of_allowed", "_registry")
+
     def __init__(self, num_of_allowed: int = 1000):
         """Initor, který přijímá maximální počet interakcí pro libovolný typ.
         Pokud je tento limit dovršen, bude daná interakce zamítnuta.
         """
         self._num_of_allowed = num_of_allowed
-        self._registry = {}
+
+        """Registratura počtu aplikovaných interakcí podle jejich typu.
+        Klíčem je přímo typ (třída) interakce."""
+        self._registry: "dict[type, int]" = {}
 
     def tick(self, interaction: "interaction_module.Interaction") -> int:
         """Funkce, která započte interakci do registrace.
@@ -103,14 +120,11 @@ class LimitPerInteractionType(InteractionRule):
         o 1, pokud není, je počet aplikovaných interakcí daného typu nastaven
         na 1. Nově nastavený počet je dále vrácen.
         """
-        typename = interaction.interaction_type.__name__
-        if typename in self._registry:
-            """Pokud je daný typ evidován v registratuře"""
-            self._registry[typename] += 1
-        else:
-            """Pokud daný typ interakce doposud v registratuře evidován není"""
-            self._registry[typename] = 1
-        return self._registry[typename]
+        registry = self._registry
+        interaction_type = interaction.interaction_type
+        count = registry.get(interaction_type, 0) + 1
+        registry[interaction_type] = count
+        return count
 
     def check(self, interaction: "interaction_module.Interaction") -> bool:
         """Funkce vrací, zda byl či nebyl překročen limit aplikovatelných
@@ -127,22 +141,40 @@ class InteractionRuleManager:
         """Initor, který pouze připravuje seznam interakčních pravidel.
         Ten je na počátku prázdný; pravidla se přidávají až během dalších
         fází životního cyklu instance.
+
+        Pravidla jsou uchovávána v ntici, která je při přidání pravidel
+        nahrazena novou. Vyhodnocení interakce tak nemusí evidenci kopírovat.
         """
-        self._rules: "list[InteractionRule]" = []
+        self._rules: "tuple[InteractionRule, ...]" = ()
+
+        """Zámek chránící přidávání pravidel, aby se souběžně přidaná
+        pravidla navzájem nepřepsala. Vyhodnocování pravidel ntici pouze
+        čte, a zámek proto nepoužívá."""
+        self._lock = Lock()
+
+        """Funkce vyhodnocující porušená pravidla specializovaná pro
+        aktuální sadu pravidel (viz funkce 'compile'). Při přidání pravidel
+        je zahozena a vytvořena znovu při dalším vyhodnocení."""
+        self._compiled: "Callable" = None
 
     @property
     def interaction_rules(self) -> "tuple[InteractionRule]":
         """Vlastnost vrací ntici reprezentující množinu interakčních pravidel.
         """
-        return tuple(self._rules)
+        return self._rules
 
     def add_interaction_rule(self, rule: "InteractionRule"):
         """Funkce přidá interakční pravidlo do evidence."""
-        self._rules.append(rule)
+        with self._lock:
+            self._rules = (*self._rules, rule)
+            self._compiled = None
 
     def add_all_interaction_rules(self, rules: "Iterable[InteractionRule]"):
         """Funkce přidá všechna dodaná interakční pravidla do evidence."""
-        self._rules.extend(rules)
+        rules = tuple(rules)
+        with self._lock:
+            self._rules = (*self._rules, *rules)
+            self._compiled = None
 
     def violated_rules(self, interaction: "interaction_module.Interaction"
                        ) -> "tuple[InteractionRule]":
@@ -151,8 +183,72 @@ class InteractionRuleManager:
 
         Všechna vrácená pravidla značí ta porušená. Pokud je vrácená ntice
         prázdná, znamená to, že žádné nebylo při zpracování porušeno."""
-        return tuple(filter(
-            lambda rule: not rule.check(interaction), self.interaction_rules))
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self.compile()
+        return compiled(interaction)
+
+    def compile(self) -> "Callable[[interaction_module.Interaction], tuple]":
+        """Funkce vytvoří (a uloží) funkci vyhodnocující porušená pravidla,
+        specializovanou pro aktuální sadu pravidel. Pro nejběžnější počty
+        pravidel (žádné, jedno či dvě) jsou pravidla uložena přímo v
+        uzávěru a ověřena bez procházení ntice. Ověřovací funkce pravidel
+        jsou v uzávěru uloženy již navázané na svá pravidla, aby nemusely
+        být při každém vyhodnocení znovu vyhledávány.
+
+        Výsledek vyhodnocení je stejný jako u funkce 'violated_rules';
+        ověřena jsou vždy všechna pravidla v pořadí jejich přidání."""
+        rules = self._rules
+
+        if len(rules) == 0:
+            def violated(interaction):
+                return ()
+
+        elif len(rules) == 1:
+            check = rules[0].check
+
+            def violated(interaction):
+                return () if check(interaction) else rules
+
+        elif len(rules) == 2:
+            first, second = rules
+            first_check, second_check = first.check, second.check
+
+            def violated(interaction):
+                first_ok = first_check(interaction)
+                second_ok = second_check(interaction)
+                if first_ok and second_ok:
+                    return ()
+                elif first_ok:
+                    return second,
+                elif second_ok:
+                    return first,
+                return rules
+
+        else:
+            checks = tuple([(rule, rule.check) for rule in rules])
+
+            def violated(interaction):
+                return tuple([rule for rule, check in checks
+                              if not check(interaction)])
+
+        self._compiled = violated
+        return violated
+
+    def any_violated(self, interaction: "interaction_module.Interaction"
+                     ) -> bool:
+        """Funkce vrací, zda-li dodaná interakce porušuje alespoň jedno
+        z interakčních pravidel. Vyhodnocování je ukončeno u prvního
+        porušeného pravidla.
+
+        Pravidla si mohou při ověřování vést záznamy (např. počítadla
+        interakcí); pravidla za prvním porušeným tak interakci nezapočtou.
+        Pokud je třeba započtení všemi pravidly, je namístě funkce
+        'violated_rules'."""
+        for rule in self._rules:
+            if not rule.check(interaction):
+                return True
+        return False
 
 
 class InteractionRuleManagerFactory(ABC):
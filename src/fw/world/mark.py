@@ -1,8 +1,11 @@
 """V tomto modulu jsou obsaženy definice značkování políček."""
 
 # Import standardních knihoven
+import sys
 from abc import ABC, abstractmethod
-from typing import Iterable
+from functools import lru_cache
+from threading import Lock
+from typing import Callable, Iterable
 
 # Import lokálních knihoven
 from src.fw.utils.error import PlatformError
@@ -15,6 +18,8 @@ class Mark:
     Hlavním významem těchto instancí je vytvoření možnosti značkovat políčka
     světa a opatřit je patřičným textem."""
 
+    __slots__ = ("__text",)
+
     def __init__(self, text: str):
         """Initor třídy, který slouží k zadání neměnného textu reprezentujícího
         danou značku. Ten je nastaven do privátní proměnné.
@@ -31,20 +36,47 @@ class Mark:
         return f"[{self.text}]"
 
 
+@lru_cache(maxsize=256)
+def _shared_mark(text: str) -> "Mark":
+    """Funkce vrací značku s dodaným textem, přičemž pro opakující se texty
+    vrací tutéž (neměnnou) instanci. Text je internalizován. Zásoba
+    sdílených značek je omezena na posledních 256 textů; používá se pouze
+    pro texty, které již prošly ověřením pravidly."""
+    return Mark(sys.intern(text))
+
+
 class MarkRule(ABC):
     """Abstraktní funkce MarkRule definuje protokol pro ověřující pravidla,
-    která jsou závazná pro tvořené značky."""
+    která jsou závazná pro tvořené značky.
+
+    Třída deklaruje prázdné sloty; potomci si své atributy ukládají do
+    vlastních slotů."""
+
+    __slots__ = ()
+
+    # Odhad relativní ceny ověření; při zjišťování, zda-li je značka
+    # přípustná, jsou levnější pravidla ověřována dříve
+    cost: int = 1
 
     @abstractmethod
     def check(self, mark: "Mark") -> bool:
         """Abstraktní funkce definuje protokol svojí signaturou. Její
         implementace slouží k ověření platnosti značky."""
 
+    def check_text(self, text: str) -> bool:
+        """Funkce ověřuje platnost samotného textu potenciální značky.
+        Výchozí implementace text obalí značkou a ověří ji funkcí 'check';
+        potomci, kteří posuzují pouze text, ji přepisují, aby nebylo nutné
+        značku vytvářet."""
+        return self.check(Mark(text))
+
 
 class MaxLength(MarkRule):
     """Toto pravidlo definuje omezení, že texty značek nesmí být delší, než
     stanovený počet znaků."""
 
+    __slots__ = ("_max_length",)
+
     def __init__(self, max_length: int = 3):
         """Initor, který přijímá stanovený maximální počet znaků. Jeho
         defaultní hodnota jsou 3 znaky."""
@@ -58,7 +90,12 @@ class MaxLength(MarkRule):
     def check(self, mark: "Mark") -> bool:
         """Funkce se pokusí ověřit, zda dodaný text značky je kratší nebo
         roven maximální povolené délce."""
-        return len(mark.text) <= self.max_length
+        return self.check_text(mark.text)
+
+    def check_text(self, text: str) -> bool:
+        """Funkce ověřuje, zda je dodaný text kratší nebo roven maximální
+        povolené délce."""
+        return len(text) <= self._max_length
 
     def __str__(self) -> str:
         """Textová reprezentace pravidla. Typicky by měla popisovat svoje
@@ -69,6 +106,8 @@ class MaxLength(MarkRule):
 class MinLength(MarkRule):
     """Instance této třídy slouží k omezení minimální délky textu značky."""
 
+    __slots__ = ("_min_length",)
+
     def __init__(self, min_length: int = 1):
         """Initor třídy, který ukládá minimální délku textu značky. Defaultně
         je tato hodnota nastavena na 1; při hodnotě 0 bude tato instance při
@@ -85,7 +124,12 @@ class MinLength(MarkRule):
     def check(self, mark: "Mark") -> bool:
         """Funkce ověřuje, zda text značky odpovídá kvótě o minimální délce
         textu."""
-        return len(mark.text) >= self.min_length
+        return self.check_text(mark.text)
+
+    def check_text(self, text: str) -> bool:
+        """Funkce ověřuje, zda dodaný text odpovídá kvótě o minimální délce.
+        """
+        return len(text) >= self._min_length
 
     def __str__(self) -> str:
         """Textová reprezentace pravidla. Typicky by měla popisovat svoje
@@ -93,17 +137,86 @@ class MinLength(MarkRule):
         return f"Text značky musí být minimálně {self.min_length} znaků dlouhý"
 
 
+class LengthRange(MarkRule):
+    """Pravidlo sdružuje omezení minimální i maximální délky textu značky
+    (viz pravidla MinLength a MaxLength). Obě meze jsou ověřeny jediným
+    voláním a jediným zjištěním délky textu."""
+
+    __slots__ = ("_min_length", "_max_length")
+
+    def __init__(self, min_length: int = 1, max_length: int = 3):
+        """Initor, který přijímá minimální a maximální délku textu značky.
+        Defaultně musí mít text 1 až 3 znaky. Pro zápornou minimální délku
+        je nastavena 0 (stejně jako u pravidla MinLength)."""
+        self._min_length = min_length if min_length > 0 else 0
+        self._max_length = max_length
+
+    @property
+    def min_length(self) -> int:
+        """Vlastnost vrací minimální délku textu značky."""
+        return self._min_length
+
+    @property
+    def max_length(self) -> int:
+        """Vlastnost vrací maximální délku textu značky."""
+        return self._max_length
+
+    def check(self, mark: "Mark") -> bool:
+        """Funkce ověřuje, zda délka textu značky leží mezi minimální
+        a maximální povolenou délkou (včetně)."""
+        return self.check_text(mark.text)
+
+    def check_text(self, text: str) -> bool:
+        """Funkce ověřuje, zda délka dodaného textu leží mezi minimální
+        a maximální povolenou délkou (včetně)."""
+        return self._min_length <= len(text) <= self._max_length
+
+    def __str__(self) -> str:
+        """Textová reprezentace pravidla. Typicky by měla popisovat svoje
+        rozhodovací kritérium."""
+        return (f"Text značky musí být minimálně {self.min_length} a "
+                f"maximálně {self.max_length} znaků dlouhý")
+
+
 class AllowedCharset(MarkRule):
     """Instance této třídy slouží k ověřování, že texty značek se sestávají
      výhradně jen ze znaků ze stanovené znakové sady."""
 
+    __slots__ = ("_charset", "_charset_set", "_deletion_table")
+
     # Výchozí znaková sada
     default_charset = tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ1234567890")
 
+    # Množina a překladová tabulka výchozí znakové sady sdílené všemi
+    # pravidly, která výchozí sadu používají
+    _default_charset_set = frozenset(default_charset)
+    _default_deletion_table = str.maketrans("", "", "".join(default_charset))
+
+    # Délka textu, od které je výhodnější ověřovat text překladovou tabulkou
+    _TRANSLATE_THRESHOLD = 16
+
+    # Ověření prochází celý text, je tedy dražší než ověření jeho délky
+    cost = 2
+
     def __init__(self, charset: "Iterable[str]" = default_charset):
         """Initor třídy, který přijímá v parametru iterovatelnou množinu
-        znaků, které omezují použitelné texty značek co do obsahu."""
+        znaků, které omezují použitelné texty značek co do obsahu.
+
+        Kromě ntice znaků (v dodaném pořadí) je uložena i jejich množina,
+        v níž je ověření přítomnosti znaku jediným dotazem do hashovací
+        tabulky, a překladová tabulka, která všechny povolené znaky maže
+        (víceznakové položky sady žádnému znaku odpovídat nemohou).
+        Pro výchozí znakovou sadu jsou použity sdílené předpočítané
+        struktury."""
+        if charset is AllowedCharset.default_charset:
+            self._charset = charset
+            self._charset_set = AllowedCharset._default_charset_set
+            self._deletion_table = AllowedCharset._default_deletion_table
+            return
         self._charset = tuple(charset)
+        self._charset_set = frozenset(self._charset)
+        self._deletion_table = str.maketrans("", "", "".join(
+            [char for char in self._charset if len(char) == 1]))
 
     @property
     def charset(self) -> "tuple[str]":
@@ -113,10 +226,18 @@ class AllowedCharset(MarkRule):
     def check(self, mark: "Mark") -> bool:
         """Funkce ověřuje, zda-li je značka značky sestaven z pouze povolených
         znaků či zda obsahuje i nějaké nepovolené."""
-        for char in tuple(mark.text):
-            if char not in self.charset:
-                return False
-        return True
+        return self.check_text(mark.text)
+
+    def check_text(self, text: str) -> bool:
+        """Funkce ověřuje, zda-li je dodaný text sestaven pouze z povolených
+        znaků.
+
+        Krátké texty jsou ověřeny vůči množině znaků. Z delších textů jsou
+        povolené znaky smazány překladovou tabulkou; pokud nic nezbude,
+        obsahoval text pouze povolené znaky."""
+        if len(text) < self._TRANSLATE_THRESHOLD:
+            return self._charset_set.issuperset(text)
+        return not text.translate(self._deletion_table)
 
     def __str__(self) -> str:
         """Textová reprezentace pravidla. Typicky by měla popisovat svoje
@@ -124,9 +245,42 @@ class AllowedCharset(MarkRule):
         return f"Text značky smí obsahovat pouze znaky ze sady {self.charset}"
 
 
+"""Zámek chránící přidávání pravidel značek. Označitelných instancí (políček)
+je velké množství, proto sdílí jediný zámek; pravidla se přidávají jen
+zřídka a jejich ověřování zámek nepoužívá."""
+_MARK_RULES_LOCK = Lock()
+
+
+@lru_cache(maxsize=64)
+def _fused_mark_rules(rules: "tuple[MarkRule, ...]"
+                      ) -> "Callable[[str], tuple[MarkRule, ...]]":
+    """Funkce sloučí dodaná pravidla do jediné funkce, která pro text
+    vrací porušená pravidla. Ověřovací funkce pravidel jsou v ní uloženy
+    již navázané na svá pravidla a ověřují přímo text, bez tvorby značky.
+    Sloučená funkce je pro každou ntici pravidel vytvořena jen jednou."""
+    checks = tuple([(rule, rule.check_text) for rule in rules])
+
+    def violated(text: str) -> "tuple[MarkRule, ...]":
+        return tuple([rule for rule, check in checks if not check(text)])
+
+    return violated
+
+
+@lru_cache(maxsize=64)
+def _ordered_mark_checks(
+        rules: "tuple[MarkRule, ...]") -> "tuple[Callable[[str], bool]]":
+    """Funkce vrací ověřovací funkce dodaných pravidel seřazené od
+    nejlevnějšího pravidla (viz atribut 'cost'); pravidla se stejnou cenou
+    si zachovávají své pořadí. Pro každou ntici pravidel je pořadí
+    sestaveno jen jednou."""
+    return tuple([rule.check_text
+                  for rule in sorted(rules, key=lambda rule: rule.cost)])
+
+
 """Výchozí sada pravidel, která určuje, jaké texty je možné použít pro 
-jednotlivé značky."""
-_DEFAULT_MARK_RULES = [MaxLength(), MinLength(), AllowedCharset()]
+jednotlivé značky. Je neměnná, a tak ji všechny označitelné instance
+s výchozími pravidly sdílejí bez kopírování."""
+_DEFAULT_MARK_RULES = (LengthRange(), AllowedCharset())
 
 
 class Markable(ABC):
@@ -134,16 +288,23 @@ class Markable(ABC):
     jejich ověřování.
 
     Samotné ověřování probíhá na základě pravidel, kterými jsou značky,
-    resp. jejich texty, ověřovány."""
+    resp. jejich texty, ověřovány.
+
+    Třída sama sloty nedeklaruje (prázdná ntice), aby ji bylo možné
+    kombinovat s dalšími předky. Potomci se sloty si proto musí sloty
+    '_rules' a '_mark' deklarovat sami."""
+
+    __slots__ = ()
 
     def __init__(
-            self, rules: "Iterable[MarkRule]" = tuple(_DEFAULT_MARK_RULES)):
+            self, rules: "Iterable[MarkRule]" = _DEFAULT_MARK_RULES):
         """Initor třídy, který slouží k uložení potřebných hodnot a iniciaci
         požadovaných polí. V parametru přijímá iterovatelnou množinu pravidel,
         kterými budou dané značky ověřovány.
         """
-        # Seznam ověřovacích pravidel pro nové potenciální značky
-        self._rules = list(rules)
+        # Ntice ověřovacích pravidel pro nové potenciální značky; při
+        # přidání pravidla je nahrazena novou, a lze ji tak přímo vydávat
+        self._rules: "tuple[MarkRule, ...]" = tuple(rules)
 
         # Připravení pole pro značku
         self._mark: "Mark" = None
@@ -174,21 +335,55 @@ class Markable(ABC):
     @property
     def mark_rules(self) -> "tuple[MarkRule]":
         """Vlastnost vrací ntici pravidel pro potenciální značky."""
-        return tuple(self._rules)
+        return self._rules
 
     def add_mark_rule(self, rule: "MarkRule"):
         """Funkce přidává pravidlo pro potenciální značky."""
-        self._rules.append(rule)
+        with _MARK_RULES_LOCK:
+            self._rules = (*self._rules, rule)
 
     def check_mark(self, mark: "Mark") -> bool:
         """Funkce se stará o kontrolu potenciální značky, zda-li neporušuje
-        některé pravidlo."""
-        return len(self.violated_mark_rules(mark)) == 0
+        některé pravidlo.
+
+        Pravidla jsou ověřována od nejlevnějšího a ověřování je ukončeno
+        u prvního porušeného pravidla; výčet všech porušených pravidel
+        poskytuje funkce 'violated_mark_rules'."""
+        return self.check_text(mark.text)
+
+    def check_text(self, text: str) -> bool:
+        """Funkce ověřuje přímo text potenciální značky, aniž by bylo nutné
+        značku vytvářet. Pravidla jsou ověřována od nejlevnějšího a ověřování
+        je ukončeno u prvního porušeného pravidla."""
+        for check in _ordered_mark_checks(self._rules):
+            if not check(text):
+                return False
+        return True
 
     def violated_mark_rules(self, mark: "Mark") -> "tuple[MarkRule]":
         """Funkce vrací pro dodanou značku sadu pravidel, která byla porušena.
+        Pravidla jsou vyhodnocena vždy znovu; výsledky se nezapamatovávají,
+        neboť vlastní pravidla nemusí záviset pouze na textu značky."""
+        return _fused_mark_rules(self._rules)(mark.text)
+
+    def validate_batch(
+            self, texts: "Iterable[str]") -> "tuple[tuple[MarkRule], ...]":
+        """Funkce ověří najednou všechny dodané texty potenciálních značek.
+        Pro každý text (v dodaném pořadí) vrací ntici porušených pravidel;
+        prázdná ntice značí přípustný text.
+
+        Pravidla jsou načtena (a sloučena) jen jednou pro celou dávku
+        a opakující se texty v rámci dávky jsou ověřeny pouze jednou.
         """
-        return tuple(filter(lambda r: not r.check(mark), self.mark_rules))
+        violated = _fused_mark_rules(self._rules)
+        checked: "dict[str, tuple[MarkRule]]" = {}
+        results = []
+        for text in texts:
+            result = checked.get(text)
+            if result is None:
+                result = checked[text] = violated(text)
+            results.append(result)
+        return tuple(results)
 
     def mark_yourself(self, text: str) -> "Mark":
         """Funkce se pokusí z dodaného textu vytvořit značku a tuto v sobě
@@ -196,31 +391,39 @@ class Markable(ABC):
 
         Typicky může vyhodit výjimku, a to v případě, když již jedna značka
         v této instanci je uložena, nebo když je dodaný text pro značku
-        nevyhovující (není v souladu s některým z pravidel)."""
+        nevyhovující (není v souladu s některým z pravidel).
 
-        # Vytvoření nové značky
-        new_mark = Mark(text)
+        Značka je vytvořena až v okamžiku, kdy je skutečně potřeba; text
+        je ověřen přímo, a to jediným vyhodnocením pravidel, jehož výsledek
+        slouží i pro výpis porušených pravidel."""
 
         # Pokud nemůže být tato instance označkována
         if not self.can_be_marked:
             raise MarkError(
-                f"Tato instance nemůže být označkována: {self}", new_mark)
+                f"Tato instance nemůže být označkována: {self}", Mark(text))
 
         # Pokud již jedna značka v této instanci evidována je
         elif self.has_mark:
             raise MarkError(
                 f"Jedna značka je již přítomná: '{self.mark=}'", self.mark)
 
+        # Zjištění porušených pravidel (pravidla jsou vyhodnocena jen jednou)
+        violated_rules = _fused_mark_rules(self._rules)(text)
+
         # Pokud daná značka neodpovídá pravidlům
-        elif not self.check_mark(new_mark):
+        if violated_rules:
             raise MarkError(
-                f"Značka s textem '{new_mark.text}' není přípustná: "
-                f"{self.violated_mark_rules(new_mark)}", new_mark)
+                f"Značka s textem '{text}' není přípustná: "
+                f"{violated_rules}", Mark(text))
 
         # Pokud je vše v pořádku
         else:
-            # Uložení nové značky
-            self._mark = new_mark
+            # Vytvoření (resp. převzetí sdílené) a uložení nové značky;
+            # sdílet lze pouze značky s textem typu str
+            if type(text) is str:
+                self._mark = _shared_mark(text)
+            else:
+                self._mark = Mark(text)
 
             # Upozornění na změnu značky
             from src.fw.gui.visualization import update_marks
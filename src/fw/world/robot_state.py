@@ -8,7 +8,7 @@ Stav robota se stará o umístění robota ve světě, co do jeho:
 """
 
 # Import standardních knihoven
-
+from typing import Callable
 
 # Import lokálních knihoven
 import src.fw.world.world as world_module
@@ -29,6 +29,9 @@ class RobotState:
     - otočení (kterým povoleným směrem je otočen)
     """
 
+    __slots__ = ("_world", "_robot", "_direction", "_field",
+                 "_on_field_change")
+
     def __init__(self, robot: "robot_module.Robot",
                  world: "world_module.World",
                  direction: "Direction" = None,
@@ -39,6 +42,10 @@ class RobotState:
         self._direction: "Direction" = direction
         self._field: "field_module.Field" = field
 
+        # Posluchači změny políčka; volání probíhá ve tvaru
+        # posluchač(stav_robota, původní_políčko, nové_políčko)
+        self._on_field_change: "list[Callable]" = []
+
     @property
     def world(self) -> "world_module.World":
         """Svět, ve kterém robot je."""
@@ -60,6 +67,13 @@ class RobotState:
         self._direction = direction
         visualization.update_robot()
 
+    @property
+    def on_field_change(self) -> "list[Callable]":
+        """Seznam posluchačů, kteří jsou upozorněni vždy, když je robotovi
+        nastaveno nové políčko. Každý posluchač je zavolán s argumenty
+        stavu robota, původního a nového políčka."""
+        return self._on_field_change
+
     @property
     def field(self) -> "field_module.Field":
         """Políčko, na kterém robot stojí."""
@@ -99,7 +113,13 @@ class RobotState:
                 f"Nelze robota umístit na políčko, na kterém již jeden robot "
                 f"umístěn je: {field.robot} @ [{field.x}, {field.y}]", self)
 
+        old_field = self._field
         self._field = field
+
+        # Upozornění posluchačů na změnu políčka
+        for listener in self._on_field_change:
+            listener(self, old_field, field)
+
         visualization.update_robot()
 
 
@@ -6,9 +6,10 @@
 
 
 # Import lokálních knihoven
-from typing import Callable
+from typing import Callable, Iterable
 
 import src.fw.world.robot_state as rs_module
+import src.fw.world.field as field_module
 import src.fw.robot.robot as robot_module
 import src.fw.world.spawner as spawner_module
 import src.fw.target.event_handling as event_handling
@@ -38,8 +39,22 @@ class RobotStateManager(event_handling.EventEmitter):
         # Iniciace vlastních polí
         self._spawner = spawner
 
-        # Iniciace vlastní evidence stavů robota
-        self._robot_states: "list[rs_module.RobotState]" = []
+        # Iniciace vlastní evidence stavů robota; stavy jsou evidovány ve
+        # slovníku podle robota, kterého popisují (v pořadí registrace)
+        self._states_by_robot: \
+            "dict[robot_module.Robot, rs_module.RobotState]" = {}
+
+        # Ntice stavů vydávaná vlastností 'robot_states'; vytvořena je znovu
+        # až po změně evidence
+        self._states_tuple: "tuple[rs_module.RobotState]" = None
+
+        # Množina názvů evidovaných robotů pro ověření jejich unikátnosti;
+        # název robota se během jeho života nemění
+        self._robot_names: "set[str]" = set()
+
+        # Index stavů robotů podle souřadnic políčka, na kterém robot stojí;
+        # index je udržován posluchačem změny políčka jednotlivých stavů
+        self._by_xy: "dict[tuple[int, int], rs_module.RobotState]" = {}
 
         # Uložení potrubí loggeru
         self._logger_pipeline = log
@@ -53,7 +68,10 @@ class RobotStateManager(event_handling.EventEmitter):
     def robot_states(self) -> "tuple[rs_module.RobotState]":
         """Vlastnost vrací ntici ze seznamu všech stavů robota, které
         má správce evidovány."""
-        return tuple(self._robot_states)
+        states = self._states_tuple
+        if states is None:
+            states = self._states_tuple = tuple(self._states_by_robot.values())
+        return states
 
     @property
     def spawner(self) -> "spawner_module.Spawner":
@@ -69,14 +87,11 @@ class RobotStateManager(event_handling.EventEmitter):
         return tuple(map(lambda rs: str(rs.robot.name), self.robot_states))
 
     def has_robot(self, robot: "robot_module.Robot") -> bool:
-        """Funkce se pokusí projít stavy robotů a vyhledat ten, který
-        by v sobě popisoval stav dodaného robota. Pokud je takový nalezen,
-        je vrácena hodnota True, jinak False.
+        """Funkce se pokusí vyhledat stav, který by v sobě popisoval stav
+        dodaného robota. Pokud je takový nalezen, je vrácena hodnota True,
+        jinak False.
         """
-        for robot_state in self.robot_states:
-            if robot_state.robot == robot:
-                return True
-        return False
+        return robot in self._states_by_robot
 
     def register_robot(self, robot: "robot_module.Robot"):
         """Tato funkce zaregistruje nového robota. Pokud již pro tohoto
@@ -85,56 +100,108 @@ class RobotStateManager(event_handling.EventEmitter):
         O tvorbu stavu robota se stará instance třídy Spawner, která
         robota hypoteticky usadí do políčka na příslušných souřadnicích
         a natočí ho výchozím směrem.
+
+        Jde o registraci dávky o jediném robotovi (viz 'register_robots').
         """
-        # Pokud již jednou tento robot je evidován
-        if self.has_robot(robot):
-            self.log("Robot", robot.name, "je již jednou evidován")
-            raise RobotStateManagerError(
-                f"Správce stavů robotů již robota '{robot.name}' "
-                f"s ID '{robot.id}' evidovaného má", self)
+        return self.register_robots((robot,))[0]
+
+    def register_robots(self, robots: "Iterable[robot_module.Robot]"
+                        ) -> "tuple[rs_module.RobotState]":
+        """Funkce zaregistruje najednou všechny dodané roboty.
+
+        Všichni roboti jsou nejdříve ověřeni (a to i vůči sobě navzájem);
+        pokud je některý z nich již evidován nebo se jeho název opakuje,
+        je vyhozena výjimka a není zasazen žádný z nich. Poté jsou roboti
+        postupně zasazeni do světa a pro každého z nich je vytvořena
+        událost 'SpawnRobotEvent', stejně jako při registraci jednotlivě.
+
+        Funkce vrací ntici stavů nově zaregistrovaných robotů v dodaném
+        pořadí."""
+        robots = tuple(robots)
+
+        # Ověření všech robotů před zasazením prvního z nich
+        seen_robots = set()
+        names = set(self._robot_names)
+        for robot in robots:
+
+            # Pokud již jednou tento robot je evidován
+            if self.has_robot(robot) or robot in seen_robots:
+                self.log("Robot", robot.name, "je již jednou evidován")
+                raise RobotStateManagerError(
+                    f"Správce stavů robotů již robota '{robot.name}' "
+                    f"s ID '{robot.id}' evidovaného má", self)
+
+            # Pokud je evidován robot se stejným názvem
+            elif robot.name in names:
+                self.log("Robot s názvem", robot.name,
+                         "již jednou evidován je")
+                raise RobotStateManagerError(
+                    f"Správce stavů robotů již robota s názvem "
+                    f"'{robot.name}' jednou eviduje", self)
+
+            seen_robots.add(robot)
+            names.add(robot.name)
+
+        # Zasazení robotů spawnerem, který může přípravu sdílet pro celou
+        # dávku; každý stav je evidován hned po zasazení robota
+        new_states = []
+        for robot_state in self.spawner.spawn_many(robots):
+            robot = robot_state.robot
+
+            # Přidání stavu robota do evidence
+            self._add_robot_state(robot_state)
+            new_states.append(robot_state)
+
+            # Vytvoření události
+            field = robot_state.field
+            self.notify_all_event_handlers(
+                world_events.SpawnRobotEvent(field.x, field.y, robot))
 
-        # Pokud je evidován robot se stejným názvem
-        elif robot.name in self.robot_names:
-            self.log("Robot s názvem", robot.name, "již jednou evidován je")
-            raise RobotStateManagerError(
-                f"Správce stavů robotů již robota s názvem '{robot.name}' "
-                f"jednou eviduje", self)
+            self.log("Právě byl zasazen robot", robot.name, "do světa")
 
-        # Vytvoření stavu robota
-        robot_state = self.spawner.spawn(robot)
+        # Vrácení stavů robotů
+        return tuple(new_states)
 
-        # Přidání do vlastní evidence
-        self._robot_states.append(robot_state)
+    def _add_robot_state(self, robot_state: "rs_module.RobotState"):
+        """Funkce přidá stav robota do vlastní evidence, zařadí jej do
+        indexu podle souřadnic a přihlásí se k odběru změn jeho políčka."""
+        robot = robot_state.robot
+        self._states_by_robot[robot] = robot_state
+        self._robot_names.add(robot.name)
+        self._states_tuple = None
 
-        # Vytvoření události
         field = robot_state.field
-        self.notify_all_event_handlers(
-            world_events.SpawnRobotEvent(field.x, field.y, robot))
-
-        self.log("Právě byl zasazen robot", robot.name, "do světa")
-
-        # Vrácení stavu robota
-        return robot_state
+        self._by_xy[(field.x, field.y)] = robot_state
+        robot_state.on_field_change.append(self._update_coords_index)
 
     def robot_state(self, robot: "robot_module.Robot"
                     ) -> "rs_module.RobotState":
         """Funkce se pokusí dohledat stav dodaného robota. Pokud tento není
         nalezen, je vyhozena příslušná výjimka."""
-        for robot_state in self.robot_states:
-            if robot_state.robot == robot:
-                return robot_state
-        raise RobotStateManagerError(
-            f"Neexistuje stav robota pro robota '{robot}'", self)
+        robot_state = self._states_by_robot.get(robot)
+        if robot_state is None:
+            raise RobotStateManagerError(
+                f"Neexistuje stav robota pro robota '{robot}'", self)
+        return robot_state
 
     def robot_state_by_coords(
             self, x: int, y: int) -> "rs_module.RobotState":
         """Funkce se pokusí vrátit stav robota, který je na daných
         souřadnicích. Pokud takového robota není, je vráceno None, jinak
         je vrácena instance stavu robota ('RobotState')"""
-        for robot_state in self.robot_states:
-            field = robot_state.field
-            if (field.x == x) and (field.y == y):
-                return robot_state
+        return self._by_xy.get((x, y))
+
+    def _update_coords_index(self, robot_state: "rs_module.RobotState",
+                             old_field: "field_module.Field",
+                             new_field: "field_module.Field"):
+        """Posluchač změny políčka stavu robota, který udržuje index stavů
+        podle souřadnic aktuální."""
+        by_xy = self._by_xy
+        if old_field is not None:
+            old_key = (old_field.x, old_field.y)
+            if by_xy.get(old_key) is robot_state:
+                del by_xy[old_key]
+        by_xy[(new_field.x, new_field.y)] = robot_state
 
 
 class RobotStateManagerError(PlatformError):
@@ -9,6 +9,8 @@ implementace obého."""
 
 # Import standardních knihoven
 from abc import ABC, abstractmethod
+from random import choice, randrange
+from typing import Iterable, Iterator
 
 # Import lokálních knihoven
 import src.fw.world.robot_state as rs_module
@@ -57,6 +59,18 @@ class Spawner(Named):
         jednoho robota jiným tím, že by byli dva nastavení na jedno políčko,
         stejně jako nesmí dojít k nastavení robota na políčko zdi."""
 
+    def spawn_many(self, robots: "Iterable[robot_module.Robot]"
+                   ) -> "Iterator[rs_module.RobotState]":
+        """Funkce postupně zasadí všechny dodané roboty do světa a vydává
+        jejich stavy (v dodaném pořadí). Stav je vydán hned po zasazení
+        robota, takže volající může roboty evidovat průběžně.
+
+        Výchozí implementace volá pro každého robota funkci 'spawn';
+        potomci ji mohou přepsat, pokud umí přípravu sdílet pro celou dávku.
+        """
+        for robot in robots:
+            yield self.spawn(robot)
+
 
 class SpawnerFactory(ABC):
     """Abstraktní třída SpawnerFactory má za cíl připravit instanci spawneru,
@@ -190,34 +204,58 @@ class RandomSpawner(Spawner):
         Spawner.__init__(self, "RandomSpawner")
 
     def spawn(self, robot: "robot_module.Robot") -> "rs_module.RobotState":
-        """Funkce vybere náhodné políčko (cestu) a pokusí se robota usadit.
-        V první řadě si získá všechny cesty. Poté náhodně vybírá, kam by
-        robota zasadil. Pokud se to na vybrané políčko nepovede, proces
-        náhodného výběru a pokusu o zasazení se opakuje. A to do té doby,
-        dokud nebudou vyzkoušena všechna políčka. Pokud se to ani po posledním
-        nepovede, je vyhozena výjimka o nesplnitelnosti.
+        """Funkce vybere náhodné políčko (cestu) a usadí na něj robota.
+        V první řadě si získá všechny cesty, na kterých doposud žádný robot
+        nestojí, a z nich náhodně vybere jednu. Pokud žádná taková cesta
+        není, je vyhozena výjimka o nesplnitelnosti.
         """
         if self.world is None:
             raise SpawnerError(
                 f"Svět nebyl doposud nastaven", self)
 
-        """Import funkce pro náhodný výběr"""
-        from random import choice
-        fields = list(self.world.all_paths)
-
-        while len(fields) > 0:
-            field = choice(fields)
-            if field.has_robot:
-                fields.remove(field)
-                continue
-            else:
-                field.robot = robot
-                direction = choice(Direction.list())
-                return rs_module.RobotState(
-                    robot, self.world, direction, field)
-
-        raise SpawnerError(
-            "Neexistuje políčko, do kterého by bylo možné robota vložit", self)
+        # Volné cesty, tedy ty, na kterých žádný robot nestojí
+        free_paths = [field for field in self.world.all_paths
+                      if not field.has_any_robot]
+
+        if not free_paths:
+            raise SpawnerError(
+                "Neexistuje políčko, do kterého by bylo možné robota vložit",
+                self)
+
+        field = choice(free_paths)
+        field.robot = robot
+        direction = choice(Direction.list())
+        return rs_module.RobotState(robot, self.world, direction, field)
+
+    def spawn_many(self, robots: "Iterable[robot_module.Robot]"
+                   ) -> "Iterator[rs_module.RobotState]":
+        """Funkce zasadí všechny dodané roboty na náhodné volné cesty. Volné
+        cesty jsou zjištěny jen jednou pro celou dávku; vybraná cesta je ze
+        seznamu odebrána záměnou s poslední položkou (bez posouvání seznamu).
+        Pokud se volné cesty vyčerpají, je vyhozena výjimka."""
+        if self.world is None:
+            raise SpawnerError(
+                f"Svět nebyl doposud nastaven", self)
+
+        # Volné cesty, tedy ty, na kterých žádný robot nestojí
+        free_paths = [field for field in self.world.all_paths
+                      if not field.has_any_robot]
+
+        for robot in robots:
+            if not free_paths:
+                raise SpawnerError(
+                    "Neexistuje políčko, do kterého by bylo možné robota "
+                    "vložit", self)
+
+            # Výběr náhodné cesty a její odebrání z volných cest
+            index = randrange(len(free_paths))
+            field = free_paths[index]
+            free_paths[index] = free_paths[-1]
+            free_paths.pop()
+
+            field.robot = robot
+            direction = choice(Direction.list())
+            yield rs_module.RobotState(robot, self.world, direction, field)
 
 
 class RandomSpawnerFactory(SpawnerFactory):
@@ -27,7 +27,7 @@ class World:
     def __init__(self, fields: "list[field_mod.Field]",
                  world_if_fact: "world_inter_module.WorldInterfaceFactory",
                  spawner_factory: "spawner_module.SpawnerFactory",
-                 logger: "Logger"):
+                 logger: "Logger", mutable: bool = True):
         """Initor třídy je odpovědný za přijetí všech parametrů a jejich
         uložení.
 
@@ -44,28 +44,52 @@ class World:
         která je odpovědná za vytvoření rozhraní světa, které bude tomuto
         světu náležet a které se bude starat o zajištění integrity světa při
         interakcích se světem.
+
+        Parametr 'mutable' určuje, zda-li je možné prostor světa po jeho
+        vytvoření měnit (přidávat a odebírat políčka). Pokud ne, je svět
+        rovnou zmrazen (viz funkce 'freeze').
         """
         self._fields = fields
+        self._mutable = True
+
+        """Index políček podle jejich souřadnic, díky kterému je vyhledání
+        políčka jediným dotazem do slovníku."""
+        self._field_index: "dict[tuple[int, int], field_mod.Field]" = {}
 
-        """Nastavení reference na tuto instanci světa všem políčkům světa."""
+        """Nastavení reference na tuto instanci světa všem políčkům světa
+        a jejich zařazení do indexu podle souřadnic. Zároveň je kontrolována
+        unikátnost souřadnic. Pokud existují dvě políčka se stejnými
+        souřadnicemi, znamená to narušení konzistence a je vyhozena výjimka.
+        """
+        field_index = self._field_index
         for field in self._fields:
             field.world = self
+            key = (field.x, field.y)
+            if key in field_index:
+                raise WorldError(
+                    f"Nelze evidovat dvě políčka se "
+                    f"stejnými souřadnicemi: {field.x}, {field.y}", self)
+            field_index[key] = field
+
+        """Ntice všech políček světa vydávaná vlastností 'fields'; sestavena
+        je jen jednou a znovu až po přidání či odebrání políčka."""
+        self._fields_tuple: "tuple[field_mod.Field]" = None
+
+        """Ntice všech cest světa; zda je políčko cestou, se během jeho
+        života nemění, proto je ntice sestavena jen jednou (při prvním
+        dotazu) a znovu až po přidání či odebrání políčka."""
+        self._all_paths: "tuple[field_mod.Field]" = None
+
+        """Krajní souřadnice políček světa (min. x, max. x, min. y, max. y),
+        ze kterých jsou odvozeny rozměry světa. Jsou zjištěny jediným
+        průchodem políčky a znovu až po přidání či odebrání políčka."""
+        self._extrema: "tuple[int, int, int, int]" = None
 
         """Kontrola, že počet dodaných políček je větší než nula. Svět bez
         políčka nemá smysl."""
         if len(fields) < 1:
             raise WorldError("Nelze vytvořit svět bez políčka", self)
 
-        """Kontrola unikátnosti souřadnic. Pokud existují dvě políčka se
-        stejnými souřadnicemi, znamená to narušení konzistence. Pokud dvě 
-        políčka mají stejné souřadnice, je vyhozena výjimka."""
-        for index, field in enumerate(self._fields):
-            for next_field in self._fields[index + 1:]:
-                if field.x == next_field.x and field.y == next_field.y:
-                    raise WorldError(
-                        f"Nelze evidovat dvě políčka se "
-                        f"stejnými souřadnicemi: {field.x}, {field.y}", self)
-
         """Uložení loggeru, který byl této instanci dodán. Z něj je také
         rovnou vytvořena potřebná pipeline pro tuto instanci."""
         self._logger = logger
@@ -87,23 +111,50 @@ class World:
 
         self.log(f"Vytvořen svět o šířce {self.width} a výšce {self.height}")
 
+        if not mutable:
+            self.freeze()
+
+    @property
+    def mutable(self) -> bool:
+        """Vlastnost vrací, zda-li je možné prostor světa dále měnit, tedy
+        přidávat a odebírat políčka."""
+        return self._mutable
+
+    def freeze(self):
+        """Funkce zmrazí prostor světa; od té chvíle již nelze políčka
+        přidávat ani odebírat. Seznam políček je převeden na ntici, kterou
+        rovnou vydává i vlastnost 'fields'. Opakované zmrazení nemá žádný
+        účinek."""
+        if self._mutable:
+            self._mutable = False
+            self._fields = tuple(self._fields)
+            self._fields_tuple = self._fields
+
     @property
     def fields(self) -> "tuple[field_mod.Field]":
         """Vlastnost vrací ntici ze seznamu všech políček, která má svět
-        evidována."""
-        return tuple(self._fields)
+        evidována. Ntice je sestavena jen jednou až do změny prostoru světa.
+        """
+        fields = self._fields_tuple
+        if fields is None:
+            fields = self._fields_tuple = tuple(self._fields)
+        return fields
 
     @property
     def all_paths(self) -> "tuple[field_mod.Field]":
         """Vlastnost vrací ntici ze seznamu všech políček, která jsou cestou,
         tedy potomky třídy Path."""
-        return tuple(filter(lambda field: field.is_path, self.fields))
+        all_paths = self._all_paths
+        if all_paths is None:
+            all_paths = self._all_paths = tuple([
+                field for field in self._fields if field.is_path])
+        return all_paths
 
     @property
     def all_marked_fields(self) -> "tuple[field_mod.Field]":
         """Vlastnost vrací ntici všech políček, která jsou opatřena nějakou
         značkou."""
-        return tuple(filter(lambda field: field.has_mark, self.fields))
+        return tuple([field for field in self._fields if field.has_mark])
 
     @property
     def world_interface(self) -> "world_inter_module.WorldInterface":
@@ -116,15 +167,38 @@ class World:
         instance tohoto světa v sobě uložený."""
         return self._robot_state_manager
 
+    @property
+    def _coords_extrema(self) -> "tuple[int, int, int, int]":
+        """Vlastnost vrací krajní souřadnice políček světa v ntici ve tvaru
+        (min. x, max. x, min. y, max. y). Ty jsou zjištěny jediným průchodem
+        všemi políčky a zapamatovány až do změny prostoru světa."""
+        extrema = self._extrema
+        if extrema is None:
+            fields = iter(self._fields)
+            first = next(fields)
+            min_x = max_x = first.x
+            min_y = max_y = first.y
+            for field in fields:
+                x, y = field.x, field.y
+                if x < min_x:
+                    min_x = x
+                elif x > max_x:
+                    max_x = x
+                if y < min_y:
+                    min_y = y
+                elif y > max_y:
+                    max_y = y
+            extrema = self._extrema = (min_x, max_x, min_y, max_y)
+        return extrema
+
     @property
     def width(self) -> int:
         """Vlastnost vrací šířku světa. Ta je spočítána jako rozdíl maximální
         souřadnice x políčka (tedy políčka nejvíce napravo) a minimální
         souřadnice osy x (tedy políčka nejvíce nalevo). Tento rozdíl je o 1
         navýšen, protože defaultně se indexuje od 0."""
-
-        return (max(self.fields, key=lambda f: f.x).x -
-                min(self.fields, key=lambda f: f.x).x) + 1
+        min_x, max_x, _, _ = self._coords_extrema
+        return (max_x - min_x) + 1
 
     @property
     def height(self) -> int:
@@ -132,8 +206,8 @@ class World:
         souřadnice y políčka (tedy políčka nejvýše) a minimální souřadnice
         osy y (tedy políčka nejníže). Tento rozdíl je o 1 navýšen, protože
         defaultně se indexuje od 0."""
-        return (max(self.fields, key=lambda f: f.y).y -
-                min(self.fields, key=lambda f: f.y).y) + 1
+        _, _, min_y, max_y = self._coords_extrema
+        return (max_y - min_y) + 1
 
     @property
     def world_dimensions(self) -> "tuple[int, int]":
@@ -149,8 +223,8 @@ class World:
     def fields_marked_like(self, mark_text: str) -> "tuple[field_mod.Field]":
         """Funkce vrací všechna políčka, která jsou označena specifickým
         textem. Tato vrací v ntici, přičemž může vracet prázdnou."""
-        return tuple(filter(lambda f: f.mark.text == mark_text,
-                            self.all_marked_fields))
+        return tuple([field for field in self._fields
+                      if field.has_mark and field.mark.text == mark_text])
 
     def has_field(self, x: int, y: int) -> bool:
         """Funkce vrací boolovskou informaci o tom, zda-li je v daném světě
@@ -159,19 +233,23 @@ class World:
         Funkce se pokusí políčko vyhledat a nebude-li takové s dodanými
         souřadnicemi nalezeno, je vrácena hodnota False, jinak True.
         """
-        return self.field(x, y) is not None
+        return (x, y) in self._field_index
 
     def field(self, x: int, y: int) -> "field_mod.Field":
         """Funkce vrací referenci na políčko na dodaných souřadnicích. Pokud
         pro tyto souřadnice žádné políčko není nalezeno, je vrácena hodnota
         None."""
-        for field in self.fields:
-            if field.x == x and field.y == y:
-                return field
+        return self._field_index.get((x, y))
 
     def add_field(self, field: "field_mod.Field"):
         """Funkce se pokusí přidat políčko. Pokud již políčko s takovými
-        souřadnicemi má, je vyhozena výjimka."""
+        souřadnicemi má, je vyhozena výjimka. Výjimka je vyhozena i tehdy,
+        je-li svět zmrazen."""
+
+        # Ověření, že svět lze měnit
+        if not self._mutable:
+            raise WorldError(
+                f"Nelze přidat políčko {field}, protože svět je zmrazen", self)
 
         # Ověření, že políčko s takovými souřadnicemi doposud není evidováno
         if self.has_field(field.x, field.y):
@@ -181,24 +259,55 @@ class World:
 
         # Přidání daného políčka do světa
         self._fields.append(field)
+        self._field_index[(field.x, field.y)] = field
+        self._fields_tuple = None
+        self._all_paths = None
+        self._extrema = None
+
+        # Sousedé okolních políček se změnili
+        self._reset_neighbours_around(field)
 
     def remove_field(self, x: int, y: int):
         """Funkce se pokusí odstranit políčko na dodaných souřadnicích.
-        Pokud políčko není evidováno, je vyhozena výjimka.
+        Pokud políčko není evidováno nebo je svět zmrazen, je vyhozena
+        výjimka.
         """
 
+        # Ověření, že svět lze měnit
+        if not self._mutable:
+            raise WorldError(
+                f"Nelze odstranit políčko [{x}, {y}], protože svět je "
+                f"zmrazen", self)
+
         # Pokud má tento svět políčko [x, y]
         if self.has_field(x, y):
 
             # Odstraň ho z evidence
-            self._fields.remove(self.field(x, y))
+            field = self._field_index.pop((x, y))
+            self._fields.remove(field)
+            self._fields_tuple = None
+            self._all_paths = None
+            self._extrema = None
             self.log(f"Bylo odebráno políčko [{x}, {y}]")
 
+            # Sousedé odebraného i okolních políček se změnili
+            field.reset_neighbours()
+            self._reset_neighbours_around(field)
+
         # Pokud ne, vyhoď výjimku
         else:
             raise WorldError(f"Políčko na souřadnicích [{x}, {y}] neexistuje "
                              f"a nelze tedy ani odstranit", self)
 
+    def _reset_neighbours_around(self, field: "field_mod.Field"):
+        """Funkce nechá všechna políčka sousedící s tím dodaným zapomenout
+        své uložené sousedy; po změně prostoru světa již nemusí platit."""
+        for direction in Direction:
+            moved_coords = field.coordinates.move_in_direction(direction)
+            neighbour = self.field(moved_coords.x, moved_coords.y)
+            if neighbour:
+                neighbour.reset_neighbours()
+
     def neighbours(self, x: int, y: int) -> "tuple[field_mod.Field]":
         """Funkce se pokusí získat všechna políčka sousedící s tím na dodaných
         souřadnicích ve všech platných směrech. Počet navrácených políček se
@@ -207,10 +316,14 @@ class World:
 
         Pokud na dodaných souřadnicích není evidované políčko, je vyhozena
         výjimka.
+
+        Sousedé jsou zjištěni jen jednou a uloženi v samotném políčku (viz
+        vlastnost 'neighbours' políčka); při změně prostoru světa je políčko
+        zapomene.
         """
 
         # Uložení dodaného políčka
-        field = self.field(x, y)
+        field = self._field_index.get((x, y))
 
         # Pokud políčko není ve světě evidováno
         if not field:
@@ -218,23 +331,8 @@ class World:
                 f"Nelze najít sousedy pro políčko [{x};{y}], protože není "
                 f"ve světě evidováno", self)
 
-        # Iniciace úložiště pro sousedy
-        neighbours = []
-
-        # Pro všechny směry
-        for direction in Direction:
-
-            # Souřadnice posunutého políčka v daném směru
-            moved_coords = field.coordinates.move_in_direction(direction)
-
-            # Zjištění souseda; pokud je obsažen ve světě (není None)
-            # je přidán do úložiště sousedů
-            neighbour = self.field(moved_coords.x, moved_coords.y)
-            if neighbour:
-                neighbours.append(neighbour)
-
-        # Navrácení v podobě ntice
-        return tuple(neighbours)
+        # Navrácení uložených sousedů políčka
+        return field.neighbours
 
 
 class WorldError(PlatformError):